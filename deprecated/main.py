@@ -32,16 +32,14 @@ if __name__ == "__main__":
         os.path.join(MIDI_DIR, existing_midi) if existing_midi else ""
     )
 
+    # Both animators draw on the same harmonica image; load it once
+    harmonica_layout = HarmonicaLayout(harmonica_image_path, C_NEW_MODEL_HOLE_MAPPING)
+    figure_factory = FigureFactory(harmonica_image_path)
+
     pipeline = HarmonicaTabsPipeline(
         TabMapper(C_HARMONICA_MAPPING, TEMP_DIR),
-        Animator(
-            HarmonicaLayout(harmonica_image_path, C_NEW_MODEL_HOLE_MAPPING),
-            FigureFactory(harmonica_image_path),
-        ),
-        TabPhraseAnimator(
-            HarmonicaLayout(harmonica_image_path, C_NEW_MODEL_HOLE_MAPPING),
-            FigureFactory(harmonica_image_path),
-        ),
+        Animator(harmonica_layout, figure_factory),
+        TabPhraseAnimator(harmonica_layout, figure_factory),
         AudioExtractor(VIDEO_FILES_DIR + sys.argv[1], TEMP_DIR + "extracted_audio.wav"),
         TabTextParser(tab_file_path),
         TabMatcher(),
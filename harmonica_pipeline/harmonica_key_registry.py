@@ -6,7 +6,8 @@ hole coordinate mappings, and model images.
 """
 
 from dataclasses import dataclass
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Mapping
 
 from image_converter.consts import (
     A_MODEL_HOLE_MAPPING,
@@ -22,20 +23,7 @@ from image_converter.consts import (
     G_MODEL_HOLE_MAPPING,
     C_MODEL_HOLE_MAPPING,
 )
-from tab_converter.consts import (
-    A_HARMONICA_MAPPING,
-    AB_HARMONICA_MAPPING,
-    B_HARMONICA_MAPPING,
-    BB_HARMONICA_MAPPING,
-    C_HARMONICA_MAPPING,
-    CS_HARMONICA_MAPPING,
-    D_HARMONICA_MAPPING,
-    E_HARMONICA_MAPPING,
-    EB_HARMONICA_MAPPING,
-    F_HARMONICA_MAPPING,
-    FS_HARMONICA_MAPPING,
-    G_HARMONICA_MAPPING,
-)
+from tab_converter.consts import HARMONICA_MAPPINGS
 
 
 @dataclass
@@ -44,7 +32,7 @@ class HarmonicaKeyConfig:
 
     key: str  # "C", "G", "D", etc.
     model_image: str  # Filename in harmonica-models/ directory
-    midi_mapping: Dict[int, int]  # MIDI note -> harmonica hole
+    midi_mapping: Mapping[int, int]  # MIDI note -> harmonica hole
     hole_mapping: Dict[int, Dict]  # Hole -> coordinates
 
 
@@ -53,78 +41,89 @@ HARMONICA_KEY_REGISTRY: Dict[str, HarmonicaKeyConfig] = {
     "A": HarmonicaKeyConfig(
         key="A",
         model_image="A.png",
-        midi_mapping=A_HARMONICA_MAPPING,
+        midi_mapping=HARMONICA_MAPPINGS["A"],
         hole_mapping=A_MODEL_HOLE_MAPPING,
     ),
     "AB": HarmonicaKeyConfig(
         key="AB",
         model_image="Ab.png",
-        midi_mapping=AB_HARMONICA_MAPPING,
+        midi_mapping=HARMONICA_MAPPINGS["AB"],
         hole_mapping=AB_MODEL_HOLE_MAPPING,
     ),
     "B": HarmonicaKeyConfig(
         key="B",
         model_image="b.png",
-        midi_mapping=B_HARMONICA_MAPPING,
+        midi_mapping=HARMONICA_MAPPINGS["B"],
         hole_mapping=B_MODEL_HOLE_MAPPING,
     ),
     "BB": HarmonicaKeyConfig(
         key="BB",
         model_image="Bb.png",
-        midi_mapping=BB_HARMONICA_MAPPING,
+        midi_mapping=HARMONICA_MAPPINGS["BB"],
         hole_mapping=BB_MODEL_HOLE_MAPPING,
     ),
     "C": HarmonicaKeyConfig(
         key="C",
         model_image="c.png",
-        midi_mapping=C_HARMONICA_MAPPING,
+        midi_mapping=HARMONICA_MAPPINGS["C"],
         hole_mapping=C_MODEL_HOLE_MAPPING,
     ),
     "CS": HarmonicaKeyConfig(
         key="CS",
         model_image="c#.png",
-        midi_mapping=CS_HARMONICA_MAPPING,
+        midi_mapping=HARMONICA_MAPPINGS["C#"],
         hole_mapping=CS_MODEL_HOLE_MAPPING,
     ),
     "D": HarmonicaKeyConfig(
         key="D",
         model_image="D.png",
-        midi_mapping=D_HARMONICA_MAPPING,
+        midi_mapping=HARMONICA_MAPPINGS["D"],
         hole_mapping=D_MODEL_HOLE_MAPPING,
     ),
     "E": HarmonicaKeyConfig(
         key="E",
         model_image="E.png",
-        midi_mapping=E_HARMONICA_MAPPING,
+        midi_mapping=HARMONICA_MAPPINGS["E"],
         hole_mapping=E_MODEL_HOLE_MAPPING,
     ),
     "EB": HarmonicaKeyConfig(
         key="EB",
         model_image="Eb.png",
-        midi_mapping=EB_HARMONICA_MAPPING,
+        midi_mapping=HARMONICA_MAPPINGS["EB"],
         hole_mapping=EB_MODEL_HOLE_MAPPING,
     ),
     "F": HarmonicaKeyConfig(
         key="F",
         model_image="F.png",
-        midi_mapping=F_HARMONICA_MAPPING,
+        midi_mapping=HARMONICA_MAPPINGS["F"],
         hole_mapping=F_MODEL_HOLE_MAPPING,
     ),
     "FS": HarmonicaKeyConfig(
         key="FS",
         model_image="F#.png",
-        midi_mapping=FS_HARMONICA_MAPPING,
+        midi_mapping=HARMONICA_MAPPINGS["F#"],
         hole_mapping=FS_MODEL_HOLE_MAPPING,
     ),
     "G": HarmonicaKeyConfig(
         key="G",
         model_image="G.png",
-        midi_mapping=G_HARMONICA_MAPPING,
+        midi_mapping=HARMONICA_MAPPINGS["G"],
         hole_mapping=G_MODEL_HOLE_MAPPING,
     ),
 }
 
 
+# Common key name aliases
+KEY_ALIASES = {
+    "F#": "FS",
+    "C#": "CS",
+    "AB": "AB",  # Already correct but listed for clarity
+    "EB": "EB",  # Already correct but listed for clarity
+    "BB": "BB",  # Already correct but listed for clarity
+}
+
+
+@lru_cache(maxsize=32)
 def get_harmonica_config(key: str) -> HarmonicaKeyConfig:
     """
     Get configuration for a harmonica key.
@@ -149,15 +148,6 @@ def get_harmonica_config(key: str) -> HarmonicaKeyConfig:
     """
     key = key.upper()
 
-    # Support common key name aliases
-    KEY_ALIASES = {
-        "F#": "FS",
-        "C#": "CS",
-        "AB": "AB",  # Already correct but listed for clarity
-        "EB": "EB",  # Already correct but listed for clarity
-        "BB": "BB",  # Already correct but listed for clarity
-    }
-
     # Apply alias if it exists
     key = KEY_ALIASES.get(key, key)
 
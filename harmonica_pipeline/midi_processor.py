@@ -5,9 +5,18 @@ Extracts MIDI processing logic from VideoCreator to follow Phase 1 OOP patterns.
 """
 
 import os
-from typing import List, Tuple
+from bisect import bisect_right
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
 import pretty_midi
 
+try:
+    import symusic
+
+    SYMUSIC_AVAILABLE = True
+except ImportError:
+    SYMUSIC_AVAILABLE = False
+
 
 class MidiProcessorError(Exception):
     """Custom exception for MIDI processing errors."""
@@ -15,18 +24,30 @@ class MidiProcessorError(Exception):
     pass
 
 
+class _Note(NamedTuple):
+    """Note read by the symusic backend, shaped like a pretty_midi note."""
+
+    start: float
+    end: float
+    pitch: int
+    velocity: int
+
+
 class MidiProcessor:
     """Handles loading and processing of fixed MIDI files for video creation."""
 
-    def __init__(self, midi_path: str):
+    def __init__(self, midi_path: str, use_symusic: bool = False):
         """
         Initialize MIDI processor.
 
         Args:
             midi_path: Path to the fixed MIDI file
+            use_symusic: Parse with symusic instead of pretty_midi. Much faster
+                on large files; requires the ``fast-midi`` extra.
 
         Raises:
-            MidiProcessorError: If MIDI file doesn't exist or is invalid
+            MidiProcessorError: If MIDI file doesn't exist or is invalid, or
+                symusic was requested but is not installed
         """
         if not os.path.exists(midi_path):
             raise MidiProcessorError(f"MIDI file not found: {midi_path}")
@@ -34,7 +55,13 @@ class MidiProcessor:
         if not midi_path.lower().endswith((".mid", ".midi")):
             raise MidiProcessorError(f"Invalid MIDI file extension: {midi_path}")
 
+        if use_symusic and not SYMUSIC_AVAILABLE:
+            raise MidiProcessorError(
+                "symusic is not installed (pip install '.[fast-midi]')"
+            )
+
         self.midi_path = midi_path
+        self.use_symusic = use_symusic
 
     def load_note_events(self) -> List[Tuple[float, float, int, float, float]]:
         """
@@ -48,6 +75,55 @@ class MidiProcessor:
         """
         print(f"🎹 Loading MIDI file: {self.midi_path}")
 
+        note_events = list(self.iter_note_events())
+
+        if not note_events:
+            raise MidiProcessorError(
+                f"No valid note events found in MIDI file: {self.midi_path}"
+            )
+
+        print(f"🎵 Loaded {len(note_events)} note events from MIDI")
+        return note_events
+
+    def iter_note_events(self) -> Iterator[Tuple[float, float, int, float, float]]:
+        """
+        Yield valid note events from the MIDI file one at a time.
+
+        Lets consumers such as TabMapper map notes as they are read instead
+        of materializing the whole list first. The file is parsed when
+        iteration starts.
+
+        Yields:
+            Note events as tuples: (start, end, pitch, velocity, confidence)
+
+        Raises:
+            MidiProcessorError: If MIDI file cannot be loaded or parsed
+        """
+        if self.use_symusic:
+            tracks = self._load_tracks_symusic()
+        else:
+            tracks = self._load_tracks_pretty_midi()
+
+        for notes in tracks:
+            for note in notes:
+                # Validate note data
+                if note.start < 0 or note.end <= note.start:
+                    continue  # Skip invalid notes
+                if not (0 <= note.pitch <= 127):
+                    continue  # Skip invalid pitch values
+
+                yield (note.start, note.end, note.pitch, note.velocity / 127.0, 1.0)
+
+    def _load_tracks_pretty_midi(self) -> List[Iterable]:
+        """
+        Parse the MIDI file with pretty_midi.
+
+        Returns:
+            One list of notes per instrument
+
+        Raises:
+            MidiProcessorError: If the file cannot be parsed or has no instruments
+        """
         try:
             midi_data = pretty_midi.PrettyMIDI(self.midi_path)
         except Exception as e:
@@ -62,26 +138,53 @@ class MidiProcessor:
         for instrument in midi_data.instruments:
             instrument.pitch_bends = []
 
-        note_events = []
-        for instrument in midi_data.instruments:
-            for note in instrument.notes:
-                # Validate note data
-                if note.start < 0 or note.end <= note.start:
-                    continue  # Skip invalid notes
-                if not (0 <= note.pitch <= 127):
-                    continue  # Skip invalid pitch values
+        return [instrument.notes for instrument in midi_data.instruments]
 
-                note_events.append(
-                    (note.start, note.end, note.pitch, note.velocity / 127.0, 1.0)
-                )
+    def _load_tracks_symusic(self) -> List[Iterable]:
+        """
+        Parse the MIDI file with symusic (C++ parser, much faster than pretty_midi).
 
-        if not note_events:
+        symusic pairs overlapping note-ons of the same pitch with note-offs
+        first-in-first-out, whereas pretty_midi ends every open note of that
+        pitch at the next note-off. Note ends are re-paired here so both
+        backends yield the same events. Pitch bends are never applied to
+        notes, so there is nothing to strip.
+
+        Returns:
+            One list of notes per track
+
+        Raises:
+            MidiProcessorError: If the file cannot be parsed or has no instruments
+        """
+        try:
+            score = symusic.Score(self.midi_path, ttype="second")
+        except Exception as e:
+            raise MidiProcessorError(f"Failed to load MIDI file {self.midi_path}: {e}")
+
+        if not score.tracks:
             raise MidiProcessorError(
-                f"No valid note events found in MIDI file: {self.midi_path}"
+                f"MIDI file contains no instruments: {self.midi_path}"
             )
 
-        print(f"🎵 Loaded {len(note_events)} note events from MIDI")
-        return note_events
+        return [self._pair_like_pretty_midi(track.notes) for track in score.tracks]
+
+    @staticmethod
+    def _pair_like_pretty_midi(notes: Iterable) -> List[_Note]:
+        """End each note at the first note-off of its pitch after its start."""
+        notes = list(notes)
+        offs: Dict[int, List[float]] = {}
+        for note in notes:
+            offs.setdefault(note.pitch, []).append(note.end)
+        for pitch_offs in offs.values():
+            pitch_offs.sort()
+
+        paired = []
+        for note in notes:
+            pitch_offs = offs[note.pitch]
+            i = bisect_right(pitch_offs, note.start)
+            end = pitch_offs[i] if i < len(pitch_offs) else note.end
+            paired.append(_Note(note.start, end, note.pitch, note.velocity))
+        return paired
 
     def fix_overlapping_notes(
         self,
@@ -108,7 +211,7 @@ class MidiProcessor:
         chord_threshold_sec = chord_threshold_ms / 1000.0
 
         # Sort by start time, then by pitch for consistent ordering
-        sorted_events = sorted(note_events, key=lambda x: (x[0], x[2]))
+        sorted_events = sorted(note_events, key=itemgetter(0, 2))
 
         fixed_events = []
         truncated_count = 0
@@ -6,6 +6,7 @@ Creates harmonica animation videos from fixed MIDI files and tab notation.
 
 import os
 import time
+from operator import attrgetter
 from typing import List, Tuple, Optional, Dict, Union
 
 from harmonica_pipeline.midi_processor import MidiProcessor, MidiProcessorError
@@ -323,7 +324,9 @@ class VideoCreator:
 
         # Sort entries by time
         tab_entries_list: List[TabEntry] = tab_entries  # type: ignore[assignment]
-        sorted_entries: List[TabEntry] = sorted(tab_entries_list, key=lambda e: e.time)
+        sorted_entries: List[TabEntry] = sorted(
+            tab_entries_list, key=attrgetter("time")
+        )
 
         # Split into pages based on timing gaps (> 2 seconds indicates new phrase/page)
         pages: List[List[TabEntry]] = []
@@ -378,7 +381,7 @@ class VideoCreator:
         # Sort MIDI entries by time to maintain chronological order
         tab_entries_list: List[TabEntry] = tab_entries  # type: ignore[assignment]
         sorted_midi_entries: List[TabEntry] = sorted(
-            tab_entries_list, key=lambda e: e.time
+            tab_entries_list, key=attrgetter("time")
         )
         midi_index = 0  # Global index tracking position in MIDI entries
 
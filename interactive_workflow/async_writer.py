@@ -0,0 +1,119 @@
+"""Background writer for session persistence.
+
+Runs session file writes on a single daemon thread so workflow steps do not
+block on disk I/O. Callers serialize on their own thread and hand over
+ready-to-write bytes; operations are applied strictly in submission order.
+"""
+
+import os
+import queue
+import threading
+from typing import Optional, Tuple
+
+
+def write_file_atomic(path: str, payload: bytes) -> None:
+    """Replace a file with payload using a single write and a rename.
+
+    The payload is written to a sibling temp file through a raw descriptor
+    (no Python-level buffering), then swapped in with os.replace so readers
+    never see a partial file.
+
+    Args:
+        path: Destination file path
+        payload: Complete file contents
+    """
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+class AsyncSessionWriter:
+    """Single-writer queue for session file operations.
+
+    Supported operations:
+    - write: Atomically replace a file with the given bytes
+    - append: Append bytes to a file (created if missing)
+    - unlink: Delete a file (missing files are ignored)
+
+    Errors raised on the writer thread are kept and re-raised by the next
+    flush(), so failures still surface on the caller's thread.
+    """
+
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[Tuple[str, str, bytes]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[OSError] = None
+
+    def write(self, path: str, payload: bytes) -> None:
+        """Queue an atomic replace of path with payload.
+
+        Args:
+            path: Destination file path
+            payload: Complete file contents
+        """
+        self._submit("write", path, payload)
+
+    def append(self, path: str, payload: bytes) -> None:
+        """Queue an append of payload to path.
+
+        Args:
+            path: File to append to
+            payload: Bytes to append
+        """
+        self._submit("append", path, payload)
+
+    def unlink(self, path: str) -> None:
+        """Queue deletion of path.
+
+        Args:
+            path: File to delete
+        """
+        self._submit("unlink", path, b"")
+
+    def flush(self) -> None:
+        """Block until every queued operation has been applied.
+
+        Raises:
+            OSError: If a queued operation failed
+        """
+        if self._thread is not None:
+            self._queue.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _submit(self, op: str, path: str, payload: bytes) -> None:
+        """Queue an operation, starting the writer thread on first use."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="session-writer", daemon=True
+            )
+            self._thread.start()
+        self._queue.put((op, path, payload))
+
+    def _run(self) -> None:
+        """Apply queued operations in order (writer thread)."""
+        while True:
+            op, path, payload = self._queue.get()
+            try:
+                if op == "write":
+                    write_file_atomic(path, payload)
+                elif op == "append":
+                    with open(path, "ab") as f:
+                        f.write(payload)
+                else:
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+            except OSError as e:
+                if self._error is None:
+                    self._error = e
+            finally:
+                self._queue.task_done()
@@ -5,22 +5,197 @@ This module orchestrates the complete interactive workflow:
 2. Initialize or resume workflow session
 3. Execute pipeline steps with user approval gates
 4. Handle cleanup and finalization
+
+Import cost: only light modules are imported at module level. questionary
+(prompt_toolkit) is imported by the steps that prompt, and pipeline modules
+(TensorFlow via basic_pitch, MoviePy, ...) only inside the step that needs
+them, so resuming or skipping straight to a late stage never pays for them.
+Keep new heavy imports inside step methods.
 """
 
+import atexit
+import importlib
 import logging
+import multiprocessing
 import os
 import platform
 import subprocess
+import sys
+import threading
 import warnings
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import cached_property
+from operator import attrgetter
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Literal
 
-import questionary
 from rich.console import Console
 from rich.panel import Panel
+from rich.text import Text
 
+from interactive_workflow.async_writer import AsyncSessionWriter
 from interactive_workflow.state_machine import WorkflowSession, WorkflowState
 from utils.filename_parser import parse_filename
-from utils.utils import get_project_temp_dir
+from utils.utils import (
+    MIDI_DIR,
+    OUTPUTS_DIR,
+    TAB_FILES_DIR,
+    VIDEO_FILES_DIR,
+    clone_file,
+    get_project_temp_dir,
+)
+
+# Suppress Python warnings (scikit-learn, etc.); these filters are
+# process-global, so they are installed once at import time
+warnings.filterwarnings("ignore", category=UserWarning)
+warnings.filterwarnings("ignore", category=FutureWarning)
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+
+# Third-party loggers that only write to the session log file
+NOISY_LOGGERS = (
+    "moviepy",
+    "imageio",
+    "imageio_ffmpeg",
+    "PIL",
+    "matplotlib",
+    "numba",
+    "tensorflow",
+    "absl",
+    "basic_pitch",
+    "librosa",
+)
+
+# Pipeline modules imported by the review/tab steps; preloaded in the
+# background while the user works through the earlier prompts
+PIPELINE_MODULES = (
+    "harmonica_pipeline.harmonica_key_registry",
+    "harmonica_pipeline.midi_processor",
+    "harmonica_pipeline.video_creator_config",
+    "harmonica_pipeline.video_creator",
+    "tab_converter.tab_mapper",
+    "tab_converter.tab_generator",
+)
+
+# Session log file handlers already installed, keyed by log file path
+_LOG_HANDLERS: dict[str, logging.FileHandler] = {}
+
+# Write buffer for generated tab files (128 KiB)
+TAB_WRITE_BUFFER_SIZE = 1 << 17
+
+# Copy chunk size for ZIP entries (1 MiB)
+ZIP_COPY_CHUNK_SIZE = 1 << 20
+
+# Roots (relative to the working directory) for the final ZIP, the
+# archived MIDI/tab sources, and the harmonica model images
+ZIP_OUTPUT_ROOT = Path("outputs")
+LEGACY_ROOT = Path("legacy")
+HARMONICA_MODELS_ROOT = Path("harmonica-models")
+
+# Prompts with fixed content, built (and their markup parsed) once
+_STEM_SELECTION_PANEL = Panel(
+    Text.from_markup(
+        "[cyan]Stem Separation[/cyan]\n\n"
+        "Separate harmonica from other instruments for better MIDI detection.\n\n"
+        "[bold]Option 1:[/bold] Run Demucs AI (automatic, ~30 seconds)\n"
+        "[bold]Option 2:[/bold] Use pre-separated file from video-files/"
+    ),
+    title="Stem Selection",
+)
+_DEMUCS_PANEL = Panel(
+    Text.from_markup(
+        "[cyan]Running Demucs Stem Separation[/cyan]\n\n"
+        "Model: htdemucs_6s (6 stems)\n"
+        "Output: stems/ folder\n"
+        "Using: 'other' stem (best for harmonica)\n\n"
+        "[dim]This may take 30-60 seconds...[/dim]"
+    ),
+    title="Demucs",
+)
+_FPS_PANEL = Panel(
+    Text.from_markup(
+        "[cyan]Select video frame rate (FPS)[/cyan]\n\n"
+        "Lower FPS = faster rendering (good for long videos with sparse notes)\n"
+        "Higher FPS = smoother animation (better for fast note sequences)\n\n"
+        "[dim]Tip: For 2+ minute videos with few notes, use 5-10 FPS[/dim]"
+    ),
+    title="Video Quality Settings",
+)
+_FINALIZATION_PANEL = Panel(
+    Text.from_markup(
+        "[cyan]Finalizing workflow...[/cyan]\n"
+        "- Creating output ZIP\n"
+        "- Archiving MIDI and tabs\n"
+        "- Session cleanup"
+    ),
+    title="Finalization",
+)
+
+
+def _import_modules(module_names: tuple[str, ...]) -> None:
+    """Import modules so later imports are sys.modules hits.
+
+    Failures are logged and left for the real import site to raise.
+
+    Args:
+        module_names: Dotted module names to import
+    """
+    for name in module_names:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            logging.warning(f"Background import of {name} failed: {e}")
+
+
+def _render_video(config, create_harmonica: bool, create_tabs: bool) -> None:
+    """Render a video with VideoCreator (module-level so it can run in a worker process).
+
+    Args:
+        config: VideoCreatorConfig for the render
+        create_harmonica: Whether to render the harmonica animation
+        create_tabs: Whether to render the tab video
+    """
+    from harmonica_pipeline.video_creator import VideoCreator
+
+    VideoCreator(config).create(
+        create_harmonica=create_harmonica, create_tabs=create_tabs
+    )
+
+
+def _stat_or_none(path: str) -> os.stat_result | None:
+    """Stat a path in one syscall, returning None if it doesn't exist.
+
+    Args:
+        path: File path to stat
+
+    Returns:
+        stat result, or None if the path is missing
+    """
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _index_dir(path: str) -> set[str]:
+    """Return the set of entry names in a directory (empty if unreadable).
+
+    A single scandir pass replaces repeated os.path.exists() probes for
+    files whose names are known up front.
+
+    Args:
+        path: Directory to index
+
+    Returns:
+        Set of file and directory names in the directory
+    """
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
 
 
 class WorkflowOrchestrator:
@@ -44,6 +219,38 @@ class WorkflowOrchestrator:
         "finalize": WorkflowState.FINALIZATION,
     }
 
+    # Set once the noisy third-party loggers have been silenced
+    _noisy_configured = False
+
+    # States that wait on the user - the session is flushed to disk before
+    # entering them so an abandoned prompt can always be resumed. Automatic
+    # transitions in between are batched into the next flush.
+    PERSIST_BEFORE_STATES = frozenset(
+        {
+            WorkflowState.STEM_SELECTION,
+            WorkflowState.MIDI_FIXING,
+            WorkflowState.TAB_GENERATION,
+            WorkflowState.HARMONICA_REVIEW,
+            WorkflowState.TAB_VIDEO_REVIEW,
+        }
+    )
+
+    # States that end run()
+    TERMINAL_STATES = frozenset({WorkflowState.COMPLETE, WorkflowState.ERROR})
+
+    # Step method for each active state. Names rather than bound methods so
+    # per-instance overrides (and test patches) are honoured at dispatch.
+    STEP_HANDLERS = {
+        WorkflowState.INIT: "_step_initialize",
+        WorkflowState.STEM_SELECTION: "_step_stem_selection",
+        WorkflowState.MIDI_GENERATION: "_step_midi_generation",
+        WorkflowState.MIDI_FIXING: "_step_midi_fixing",
+        WorkflowState.TAB_GENERATION: "_step_tab_generation",
+        WorkflowState.HARMONICA_REVIEW: "_step_harmonica_review",
+        WorkflowState.TAB_VIDEO_REVIEW: "_step_tab_video_review",
+        WorkflowState.FINALIZATION: "_step_finalization",
+    }
+
     def __init__(
         self,
         input_video: str,
@@ -66,6 +273,31 @@ class WorkflowOrchestrator:
         self.session_dir = session_dir
         self.skip_to = skip_to
 
+        # A new or resumed session has not been written by this instance yet
+        self._session_dirty = True
+        self._session_written = False
+        # Saves after the first go through a background writer thread
+        self._writer = AsyncSessionWriter()
+
+        # File browser processes started by _open_folder (never waited on)
+        self._spawned_openers: list[subprocess.Popen] = []
+        # Folders already shown to the user this run
+        self._opened_folders: set[str] = set()
+
+        # Background import of the MIDI generator (see _start_midi_warmup)
+        self._midi_warmup: Future | None = None
+        # Background import of the video/tab pipeline (see run)
+        self._pipeline_warmup: Future | None = None
+        # Tab video rendered alongside the harmonica video (auto-approve)
+        self._tab_video_render: Future | None = None
+        self._tab_video_executor: ProcessPoolExecutor | None = None
+        # Harmonica VideoCreator reused across review retries: (config,
+        # tabs file mtime, creator); see _harmonica_video_creator
+        self._harmonica_creator: tuple | None = None
+
+        # MIDI_DIR listing cached by _apply_skip_to (None = not indexed)
+        self._midi_index: set[str] | None = None
+
         # Configure logging to suppress library warnings
         self._configure_logging(session_dir)
 
@@ -74,7 +306,11 @@ class WorkflowOrchestrator:
 
         # Initialize or resume session
         self.session_file = self._get_session_file_path(session_dir)
+        self._session_files = _index_dir(session_dir)
         self.session = self._initialize_session(input_video, input_tabs)
+        self._paths = self._build_paths()
+        # The key is fixed for the lifetime of a session
+        self._harmonica_key = self.session.config.get("key", "C")
 
         # Create project-specific temp directory for parallel project support
         self.project_temp_dir = get_project_temp_dir(self.session.song_name)
@@ -92,59 +328,70 @@ class WorkflowOrchestrator:
         Args:
             session_dir: Directory to store the log file
         """
+        file_handler = self._install_log_handler(session_dir)
+        self._silence_noisy_loggers()
+
+        # Route noisy library loggers and Python warnings to this log file
+        for logger_name in (*NOISY_LOGGERS, "py.warnings"):
+            logger = logging.getLogger(logger_name)
+            if file_handler not in logger.handlers:
+                logger.addHandler(file_handler)
+
+        # Log session start
+        logging.info(f"Workflow session started at {datetime.now()}")
+
+    def _install_log_handler(self, session_dir: str) -> logging.FileHandler:
+        """Create the session log file handler (once per log file).
+
+        Args:
+            session_dir: Directory to store the log file
+
+        Returns:
+            File handler attached to the root logger
+        """
         os.makedirs(session_dir, exist_ok=True)
         log_file = os.path.join(session_dir, "workflow.log")
         self.log_file = log_file
 
-        # Create file handler for all warnings/errors
-        file_handler = logging.FileHandler(log_file, mode="a")
-        file_handler.setLevel(logging.WARNING)
-        file_handler.setFormatter(
-            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        )
-
-        # Configure root logger to use file handler
-        root_logger = logging.getLogger()
-        root_logger.addHandler(file_handler)
+        file_handler = _LOG_HANDLERS.get(log_file)
+        if file_handler is None:
+            # Create file handler for all warnings/errors
+            file_handler = logging.FileHandler(log_file, mode="a")
+            file_handler.setLevel(logging.WARNING)
+            file_handler.setFormatter(
+                logging.Formatter(
+                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+                )
+            )
+            # Configure root logger to use file handler
+            logging.getLogger().addHandler(file_handler)
+            _LOG_HANDLERS[log_file] = file_handler
+        return file_handler
+
+    @classmethod
+    def _silence_noisy_loggers(cls) -> None:
+        """Keep third-party loggers off the console (process-wide, once)."""
+        if cls._noisy_configured:
+            return
 
         # Suppress noisy third-party loggers (redirect to file only)
-        noisy_loggers = [
-            "moviepy",
-            "imageio",
-            "imageio_ffmpeg",
-            "PIL",
-            "matplotlib",
-            "numba",
-            "tensorflow",
-            "absl",
-            "basic_pitch",
-            "librosa",
-        ]
-        for logger_name in noisy_loggers:
+        for logger_name in NOISY_LOGGERS:
             logger = logging.getLogger(logger_name)
             logger.setLevel(logging.ERROR)
-            # Only use file handler, not console
-            logger.handlers = [file_handler]
             logger.propagate = False
 
-        # Suppress Python warnings (scikit-learn, etc.)
-        warnings.filterwarnings("ignore", category=UserWarning)
-        warnings.filterwarnings("ignore", category=FutureWarning)
-        warnings.filterwarnings("ignore", category=DeprecationWarning)
-
         # Redirect warnings to log file
         logging.captureWarnings(True)
-        warnings_logger = logging.getLogger("py.warnings")
-        warnings_logger.handlers = [file_handler]
-        warnings_logger.propagate = False
+        logging.getLogger("py.warnings").propagate = False
 
-        # Log session start
-        logging.info(f"Workflow session started at {datetime.now()}")
+        cls._noisy_configured = True
 
     def _open_folder(self, folder_path: str) -> None:
         """Open a folder in the system file browser.
 
         Works on macOS (Finder), Windows (Explorer), and Linux (xdg-open).
+        Each folder is opened at most once per run; its window stays open
+        across later review steps.
 
         Args:
             folder_path: Path to the folder to open
@@ -152,23 +399,74 @@ class WorkflowOrchestrator:
         if self.auto_approve:
             return  # Skip in auto-approve mode (testing)
 
+        abs_path = os.path.abspath(folder_path)
+        if abs_path in self._opened_folders:
+            return
+
         try:
-            abs_path = os.path.abspath(folder_path)
-            if not os.path.exists(abs_path):
-                os.makedirs(abs_path, exist_ok=True)
-
-            system = platform.system()
-            if system == "Darwin":  # macOS
-                subprocess.run(["open", abs_path], check=False)
-            elif system == "Windows":
-                subprocess.run(["explorer", abs_path], check=False)
-            else:  # Linux
-                subprocess.run(["xdg-open", abs_path], check=False)
+            os.makedirs(abs_path, exist_ok=True)
+            self._spawn_opener(abs_path)
 
+            self._opened_folders.add(abs_path)
             self.console.print(f"[dim]📂 Opened folder: {abs_path}[/dim]")
         except Exception as e:
             logging.warning(f"Could not open folder {folder_path}: {e}")
 
+    def _open_file(self, file_path: str) -> None:
+        """Open a file (e.g. a rendered video) in its default application.
+
+        Does not wait for the application, so the approval prompt appears
+        while the video plays. Falls back to opening the containing folder
+        if the file is missing or cannot be launched.
+
+        Args:
+            file_path: Path to the file to open
+        """
+        if self.auto_approve:
+            return  # Skip in auto-approve mode (testing)
+
+        abs_path = os.path.abspath(file_path)
+        try:
+            if not os.path.isfile(abs_path):
+                raise FileNotFoundError(abs_path)
+            if platform.system() == "Windows":
+                os.startfile(abs_path)  # type: ignore[attr-defined]
+            else:
+                self._spawn_opener(abs_path)
+            self.console.print(f"[dim]▶️  Opened: {abs_path}[/dim]")
+        except Exception as e:
+            logging.warning(f"Could not open file {file_path}: {e}")
+            self._open_folder(os.path.dirname(abs_path))
+
+    def _spawn_opener(self, abs_path: str) -> None:
+        """Launch the platform's default opener on a path without waiting.
+
+        Args:
+            abs_path: Absolute path to open
+        """
+        system = platform.system()
+        if system == "Darwin":  # macOS
+            command = "open"
+        elif system == "Windows":
+            command = "explorer"
+        else:  # Linux
+            command = "xdg-open"
+
+        # Fire-and-forget: the opener may take a while to exit and we never
+        # use its output or exit status. Reap finished openers.
+        self._spawned_openers = [
+            proc for proc in self._spawned_openers if proc.poll() is None
+        ]
+        self._spawned_openers.append(
+            subprocess.Popen(
+                [command, abs_path],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        )
+
     def _apply_skip_to(self, skip_to: str, input_video: str) -> None:
         """Apply skip_to by setting session state and required data.
 
@@ -176,8 +474,6 @@ class WorkflowOrchestrator:
             skip_to: Stage to skip to (midi-fixing, harmonica, tabs, finalize)
             input_video: Original input video path (for deriving MIDI path)
         """
-        from utils.utils import MIDI_DIR, OUTPUTS_DIR
-
         target_state = self.SKIP_TO_STATE_MAP.get(skip_to)
         if not target_state:
             self.console.print(f"[yellow]Unknown skip-to stage: {skip_to}[/yellow]")
@@ -191,10 +487,15 @@ class WorkflowOrchestrator:
             )
         )
 
+        # Index both directories once; every lookup below is then a set check
+        midi_files = _index_dir(MIDI_DIR)
+        output_files = _index_dir(OUTPUTS_DIR)
+        self._midi_index = midi_files
+
         # Set up required session data based on target state
         # All stages need the MIDI path
-        midi_path = os.path.join(MIDI_DIR, f"{self.session.song_name}_fixed.mid")
-        if os.path.exists(midi_path):
+        midi_path = self._paths.fixed_midi
+        if self._paths.fixed_midi_name in midi_files:
             self.session.set_data("generated_midi", midi_path)
             self.console.print(f"[green]✓ Found MIDI: {midi_path}[/green]")
         else:
@@ -204,61 +505,99 @@ class WorkflowOrchestrator:
             )
 
         # For harmonica/tabs/finalize, check for existing videos
-        use_alpha = self.session.config.get("use_alpha", False)
         if target_state in (
             WorkflowState.TAB_VIDEO_REVIEW,
             WorkflowState.FINALIZATION,
         ):
-            harmonica_ext = ".mov" if use_alpha else ".mp4"
-            harmonica_video = os.path.join(
-                OUTPUTS_DIR, f"{self.session.song_name}_harmonica{harmonica_ext}"
-            )
             # Also check legacy .mov path for backwards compatibility
-            if not os.path.exists(harmonica_video):
-                harmonica_video_legacy = os.path.join(
-                    OUTPUTS_DIR, f"{self.session.song_name}_harmonica.mov"
-                )
-                if os.path.exists(harmonica_video_legacy):
-                    harmonica_video = harmonica_video_legacy
-            if os.path.exists(harmonica_video):
-                self.session.set_data("harmonica_video", harmonica_video)
-                self.console.print(
-                    f"[green]✓ Found harmonica video: {harmonica_video}[/green]"
-                )
+            for name in (
+                self._paths.harmonica_video_name,
+                f"{self.session.song_name}_harmonica.mov",
+            ):
+                if name in output_files:
+                    harmonica_video = os.path.join(OUTPUTS_DIR, name)
+                    self.session.set_data("harmonica_video", harmonica_video)
+                    self.console.print(
+                        f"[green]✓ Found harmonica video: {harmonica_video}[/green]"
+                    )
+                    break
 
-        if target_state == WorkflowState.FINALIZATION:
-            full_tabs_ext = ".mov" if use_alpha else ".mp4"
-            tab_video = os.path.join(
-                OUTPUTS_DIR, f"{self.session.song_name}_full_tabs{full_tabs_ext}"
-            )
+        if target_state is WorkflowState.FINALIZATION:
             # Also check legacy .mov path
-            if not os.path.exists(tab_video):
-                tab_video_legacy = os.path.join(
-                    OUTPUTS_DIR, f"{self.session.song_name}_full_tabs.mov"
-                )
-                if os.path.exists(tab_video_legacy):
-                    tab_video = tab_video_legacy
-            if os.path.exists(tab_video):
-                self.session.set_data("tab_video", tab_video)
-                self.console.print(f"[green]✓ Found tab video: {tab_video}[/green]")
+            for name in (
+                self._paths.tab_video_name,
+                f"{self.session.song_name}_full_tabs.mov",
+            ):
+                if name in output_files:
+                    tab_video = os.path.join(OUTPUTS_DIR, name)
+                    self.session.set_data("tab_video", tab_video)
+                    self.console.print(f"[green]✓ Found tab video: {tab_video}[/green]")
+                    break
 
         # Transition to target state
         self.session.state = target_state
+        self._mark_dirty()
         self._save_session()
         self.console.print(
             f"[green]✓ Session state set to: {target_state.value}[/green]\n"
         )
 
+    def _build_paths(self) -> SimpleNamespace:
+        """Compute the per-song MIDI and output video paths.
+
+        Video extensions follow the session's use_alpha setting (.mov for
+        alpha mode, .mp4 for chromakey).
+
+        Returns:
+            Namespace with the file names and full paths for this song
+        """
+        song_name = self.session.song_name
+        video_ext = ".mov" if self.session.config.get("use_alpha", False) else ".mp4"
+        paths = SimpleNamespace(
+            fixed_midi_name=f"{song_name}_fixed.mid",
+            harmonica_video_name=f"{song_name}_harmonica{video_ext}",
+            tab_video_name=f"{song_name}_full_tabs{video_ext}",
+        )
+        paths.fixed_midi = os.path.join(MIDI_DIR, paths.fixed_midi_name)
+        paths.harmonica_video = os.path.join(OUTPUTS_DIR, paths.harmonica_video_name)
+        paths.tab_video = os.path.join(OUTPUTS_DIR, paths.tab_video_name)
+        return paths
+
+    @cached_property
+    def _harmonica_model_path(self) -> str:
+        """Path to the harmonica model image for this session's key."""
+        from harmonica_pipeline.harmonica_key_registry import get_harmonica_config
+
+        harmonica_config = get_harmonica_config(self._harmonica_key)
+        return str(HARMONICA_MODELS_ROOT / harmonica_config.model_image)
+
+    def _midi_file_exists(self, midi_name: str) -> bool:
+        """Check whether a MIDI file exists in MIDI_DIR.
+
+        Uses the directory index built by _apply_skip_to when available,
+        falling back to a stat() call otherwise.
+
+        Args:
+            midi_name: MIDI filename (without directory)
+
+        Returns:
+            True if the file exists
+        """
+        if self._midi_index is not None:
+            return midi_name in self._midi_index
+        return os.path.exists(os.path.join(MIDI_DIR, midi_name))
+
     def _get_session_file_path(self, session_dir: str) -> str:
         """Generate session file path based on song name.
 
+        The directory itself is created by _configure_logging.
+
         Args:
             session_dir: Directory for session files
 
         Returns:
             Full path to session JSON file
         """
-        os.makedirs(session_dir, exist_ok=True)
         return os.path.join(
             session_dir, f"{self.filename_config.song_name}_session.json"
         )
@@ -273,8 +612,11 @@ class WorkflowOrchestrator:
         Returns:
             WorkflowSession instance (new or resumed)
         """
-        # Try to load existing session
-        existing_session = WorkflowSession.load(self.session_file)
+        # Try to load existing session (skipped outright when the session
+        # directory listing shows no file for this song)
+        existing_session = None
+        if os.path.basename(self.session_file) in self._session_files:
+            existing_session = WorkflowSession.load(self.session_file)
 
         if existing_session:
             self.console.print(
@@ -286,10 +628,12 @@ class WorkflowOrchestrator:
                 )
             )
 
-            if (
-                self.auto_approve
-                or questionary.confirm("Resume existing session?", default=True).ask()
-            ):
+            if self.auto_approve:
+                return existing_session
+
+            import questionary
+
+            if questionary.confirm("Resume existing session?", default=True).ask():
                 return existing_session
 
         # Create new session
@@ -328,58 +672,69 @@ class WorkflowOrchestrator:
         5. Full tab video generation and review
         6. Finalization and cleanup
         """
+        # Safety net: flush any batched state if the interpreter exits mid-run
+        atexit.register(self._flush_session)
+        self._start_pipeline_warmup()
         try:
-            while not self.session.is_complete() and not self.session.is_error():
+            while True:
+                state = self.session.state
+                if state in self.TERMINAL_STATES:
+                    break
                 self._execute_current_step()
-                self._save_session()
+                # Batch fast automatic transitions; persist before user gates
+                if self.session.state in self.PERSIST_BEFORE_STATES:
+                    self._save_session()
 
-            if self.session.is_complete():
+            if state is WorkflowState.COMPLETE:
                 self._show_completion_message()
-            elif self.session.is_error():
+            else:
                 self._show_error_message()
 
         except KeyboardInterrupt:
             self.console.print("\n[yellow]Workflow interrupted by user[/yellow]")
-            self._save_session()
+            self._save_session(full=True)
             self.console.print(
                 f"[dim]Session saved. Resume with: {self.session_file}[/dim]"
             )
+        except SystemExit:
+            # User chose to exit at an approval gate; fold in the journal
+            self._save_session(full=True)
+            raise
         except Exception as e:
             self.console.print(f"\n[red]Error: {e}[/red]")
             self.session.transition_to(WorkflowState.ERROR)
             self.session.set_data("error_message", str(e))
             self._save_session()
             raise
+        finally:
+            atexit.unregister(self._flush_session)
+            # Set when the run is already failing with an exception
+            run_error = sys.exc_info()[1]
+            try:
+                self._writer.flush()
+            except OSError as e:
+                if run_error is None:
+                    raise
+                # Don't let a session write error replace the real failure
+                logging.error(f"Session write failed: {e}")
 
     def _execute_current_step(self) -> None:
         """Execute the current workflow step based on session state."""
         state = self.session.state
 
-        if state == WorkflowState.INIT:
-            self._step_initialize()
-        elif state == WorkflowState.STEM_SELECTION:
-            self._step_stem_selection()
-        elif state == WorkflowState.MIDI_GENERATION:
-            self._step_midi_generation()
-        elif state == WorkflowState.MIDI_FIXING:
-            self._step_midi_fixing()
-        elif state == WorkflowState.TAB_GENERATION:
-            self._step_tab_generation()
-        elif state == WorkflowState.HARMONICA_REVIEW:
-            self._step_harmonica_review()
-        elif state == WorkflowState.TAB_VIDEO_REVIEW:
-            self._step_tab_video_review()
-        elif state == WorkflowState.FINALIZATION:
-            self._step_finalization()
-        else:
+        handler_name = self.STEP_HANDLERS.get(state)
+        if handler_name is None:
             raise ValueError(f"Unknown workflow state: {state}")
+        getattr(self, handler_name)()
 
     def _step_initialize(self) -> None:
         """Initialize workflow - determine next step."""
-        from utils.utils import MIDI_DIR
+        import questionary
 
-        midi_path = os.path.join(MIDI_DIR, f"{self.session.song_name}_fixed.mid")
-        if os.path.exists(midi_path) and not self.auto_approve:
+        midi_path = self._paths.fixed_midi
+        if not self.auto_approve and self._midi_file_exists(
+            self._paths.fixed_midi_name
+        ):
             skip = questionary.confirm(
                 f"MIDI already exists ({midi_path}). Skip stem separation and MIDI generation?",
                 default=True,
@@ -401,6 +756,8 @@ class WorkflowOrchestrator:
         1. Run Demucs automatically (6-stem model, uses "other" stem for harmonica)
         2. Manual selection from video-files/ folder
         """
+        import questionary
+
         # Check if already selected (resuming session)
         if self.session.get_data("selected_audio"):
             self.console.print(
@@ -410,19 +767,7 @@ class WorkflowOrchestrator:
             self.session.transition_to(WorkflowState.MIDI_GENERATION)
             return
 
-        from pathlib import Path
-
-        from utils.utils import VIDEO_FILES_DIR
-
-        self.console.print(
-            Panel(
-                "[cyan]Stem Separation[/cyan]\n\n"
-                "Separate harmonica from other instruments for better MIDI detection.\n\n"
-                "[bold]Option 1:[/bold] Run Demucs AI (automatic, ~30 seconds)\n"
-                "[bold]Option 2:[/bold] Use pre-separated file from video-files/",
-                title="Stem Selection",
-            )
-        )
+        self.console.print(_STEM_SELECTION_PANEL)
 
         # Ask if user wants to run Demucs
         if not self.auto_approve:
@@ -432,6 +777,8 @@ class WorkflowOrchestrator:
             ).ask()
 
             if run_demucs:
+                # Load the MIDI generator's heavy deps while Demucs runs
+                self._start_midi_warmup()
                 if self._run_demucs_separation():
                     return  # Success - already transitioned to MIDI_GENERATION
                 # Demucs failed - fall through to manual selection
@@ -511,6 +858,62 @@ class WorkflowOrchestrator:
         self.console.print(f"[green]✓ Using audio: {selected_stem}[/green]")
         self.session.transition_to(WorkflowState.MIDI_GENERATION)
 
+    def _start_midi_warmup(self) -> None:
+        """Import the MIDI generator module in a background thread.
+
+        basic_pitch/TensorFlow take several seconds to import; doing it while
+        the Demucs subprocess runs hides that cost from _step_midi_generation.
+        """
+        if self._midi_warmup is not None:
+            return
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._midi_warmup = executor.submit(
+            importlib.import_module, "harmonica_pipeline.midi_generator"
+        )
+        executor.shutdown(wait=False)
+
+    def _wait_with_status(self, message: str, fn: Callable[[], object]) -> None:
+        """Run a long blocking call on a worker thread behind a spinner.
+
+        The main thread polls the result so the spinner keeps animating and
+        Ctrl-C is handled promptly. The worker is a daemon thread, so an
+        interrupted run exits without waiting for fn to finish. Exceptions
+        from fn propagate to the caller.
+
+        Args:
+            message: Status text shown next to the spinner
+            fn: Zero-argument callable to run
+        """
+        future: Future = Future()
+
+        def run() -> None:
+            try:
+                future.set_result(fn())
+            except BaseException as e:
+                future.set_exception(e)
+
+        # Not a ThreadPoolExecutor: concurrent.futures joins its workers at
+        # interpreter exit, which would block Ctrl-C until fn returns
+        threading.Thread(target=run, name="workflow-step", daemon=True).start()
+        with self.console.status(message):
+            # wait() returns on timeout instead of raising, which avoids
+            # futures.TimeoutError (not the builtin before Python 3.11)
+            while not wait([future], timeout=0.25).done:
+                pass
+        future.result()
+
+    def _start_pipeline_warmup(self) -> None:
+        """Import the video and tab pipeline modules in a background thread.
+
+        moviepy, matplotlib and PIL dominate the first review step's latency;
+        loading them during the earlier steps (and user prompts) hides that.
+        """
+        if self._pipeline_warmup is not None:
+            return
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._pipeline_warmup = executor.submit(_import_modules, PIPELINE_MODULES)
+        executor.shutdown(wait=False)
+
     def _run_demucs_separation(self) -> bool:
         """Run Demucs stem separation and use "other" stem for harmonica.
 
@@ -524,16 +927,7 @@ class WorkflowOrchestrator:
         """
         from utils.stem_separator import StemSeparator, StemSeparatorError
 
-        self.console.print(
-            Panel(
-                "[cyan]Running Demucs Stem Separation[/cyan]\n\n"
-                "Model: htdemucs_6s (6 stems)\n"
-                "Output: stems/ folder\n"
-                "Using: 'other' stem (best for harmonica)\n\n"
-                "[dim]This may take 30-60 seconds...[/dim]",
-                title="Demucs",
-            )
-        )
+        self.console.print(_DEMUCS_PANEL)
 
         try:
             separator = StemSeparator(output_dir="stems")
@@ -559,33 +953,22 @@ class WorkflowOrchestrator:
         Uses MidiGenerator which automatically handles:
         - Video files (.mp4, .mov) - extracts audio first
         - Audio files (.wav) - uses directly
-        """
-        from harmonica_pipeline.midi_generator import MidiGenerator
-        from utils.utils import MIDI_DIR
 
+        Runs in two stages: cheap path/existence checks and the overwrite
+        prompt first, then the generator. The generator's import (started in
+        the background by _start_pipeline_warmup/_start_midi_warmup) is only
+        waited on in the second stage, so it overlaps the prompt and is
+        skipped entirely when the existing MIDI is kept.
+        """
+        # Stage 1: paths, existing-file check and user decision (no heavy deps)
         # Use selected stem if available (from stem selection step)
         # Otherwise use original input (video or audio)
         input_file = self.session.get_data("selected_audio", self.session.input_video)
-        output_midi = os.path.join(MIDI_DIR, f"{self.session.song_name}_fixed.mid")
+        midi_name = self._paths.fixed_midi_name
+        output_midi = self._paths.fixed_midi
 
-        # Check if MIDI file already exists
-        if os.path.exists(output_midi):
-            self.console.print(
-                Panel(
-                    f"[yellow]MIDI file already exists[/yellow]\n\n"
-                    f"Found: {output_midi}\n\n"
-                    "This may be a previously fixed MIDI file.\n"
-                    "Regenerating will overwrite your edits!",
-                    title="⚠️  Existing MIDI Detected",
-                )
-            )
-
-            if (
-                self.auto_approve
-                or questionary.confirm(
-                    "Overwrite existing MIDI file?", default=False
-                ).ask()
-            ):
+        if self._midi_file_exists(midi_name):
+            if self._confirm_midi_overwrite(output_midi):
                 # User wants to overwrite - proceed with generation
                 self.console.print("[yellow]Regenerating MIDI...[/yellow]")
             else:
@@ -597,6 +980,17 @@ class WorkflowOrchestrator:
                 self.session.transition_to(WorkflowState.MIDI_FIXING)
                 return
 
+        # Stage 2: wait for the background import started earlier; on
+        # failure fall through to a regular import (which will re-raise)
+        if self._midi_warmup is not None:
+            try:
+                self._midi_warmup.result()
+            except Exception as e:
+                logging.warning(f"MIDI generator warmup failed: {e}")
+            self._midi_warmup = None
+
+        from harmonica_pipeline.midi_generator import MidiGenerator
+
         self.console.print(
             Panel(
                 f"[cyan]Generating MIDI from audio[/cyan]\n\n"
@@ -611,7 +1005,9 @@ class WorkflowOrchestrator:
         generator = MidiGenerator(
             input_file, output_midi, temp_dir=self.project_temp_dir
         )
-        generator.generate()
+        self._wait_with_status("Generating MIDI...", generator.generate)
+        if self._midi_index is not None:
+            self._midi_index.add(midi_name)
 
         # Save to session
         self.session.set_data("generated_midi", output_midi)
@@ -623,12 +1019,54 @@ class WorkflowOrchestrator:
 
         self.session.transition_to(WorkflowState.MIDI_FIXING)
 
+    def _confirm_midi_overwrite(self, output_midi: str) -> bool:
+        """Ask whether an existing MIDI file should be regenerated.
+
+        Reuses an earlier keep/overwrite answer for this exact file; a
+        changed mtime means the MIDI was rewritten, so the user is asked
+        again.
+
+        Args:
+            output_midi: Path of the existing MIDI file
+
+        Returns:
+            True to regenerate (overwrite), False to keep the existing file
+        """
+        import questionary
+
+        midi_stat = _stat_or_none(output_midi)
+        midi_mtime = midi_stat.st_mtime if midi_stat is not None else None
+        decision = self.session.get_data("midi_overwrite_decision")
+        if decision and decision.get("mtime") == midi_mtime:
+            return decision["action"] == "overwrite"
+
+        self.console.print(
+            Panel(
+                f"[yellow]MIDI file already exists[/yellow]\n\n"
+                f"Found: {output_midi}\n\n"
+                "This may be a previously fixed MIDI file.\n"
+                "Regenerating will overwrite your edits!",
+                title="⚠️  Existing MIDI Detected",
+            )
+        )
+        overwrite = bool(
+            self.auto_approve
+            or questionary.confirm("Overwrite existing MIDI file?", default=False).ask()
+        )
+        self.session.set_data(
+            "midi_overwrite_decision",
+            {"action": "overwrite" if overwrite else "keep", "mtime": midi_mtime},
+        )
+        return overwrite
+
     def _step_midi_fixing(self) -> None:
         """Pause for user to fix MIDI in DAW.
 
         User manually edits the generated MIDI in Ableton/Logic/etc.
         Workflow waits for user confirmation, then validates MIDI before continuing.
         """
+        import questionary
+
         self.console.print(
             Panel(
                 "[cyan]Fix the MIDI file in your DAW[/cyan]\n\n"
@@ -687,7 +1125,7 @@ class WorkflowOrchestrator:
 
         midi_path = self.session.get_data("generated_midi")
         tabs_path = self.session.input_tabs
-        harmonica_key = self.session.config.get("key", "C")
+        harmonica_key = self._harmonica_key
 
         if not midi_path or not os.path.exists(midi_path):
             self.console.print(
@@ -730,19 +1168,13 @@ class WorkflowOrchestrator:
         Lower FPS = faster rendering, good for sparse notes.
         Higher FPS = smoother animation, better for dense notes.
         """
+        import questionary
+
         # Check if already selected (resuming session)
         if self.session.get_data("fps"):
             return
 
-        self.console.print(
-            Panel(
-                "[cyan]Select video frame rate (FPS)[/cyan]\n\n"
-                "Lower FPS = faster rendering (good for long videos with sparse notes)\n"
-                "Higher FPS = smoother animation (better for fast note sequences)\n\n"
-                "[dim]Tip: For 2+ minute videos with few notes, use 5-10 FPS[/dim]",
-                title="Video Quality Settings",
-            )
-        )
+        self.console.print(_FPS_PANEL)
 
         if self.auto_approve:
             # Use default FPS from filename config or 15
@@ -788,15 +1220,24 @@ class WorkflowOrchestrator:
         Always offers to generate tabs from MIDI (will overwrite if file exists).
         If user declines, returns to MIDI fixing step.
         """
+        import questionary
+
         tabs_path = self.session.input_tabs
-        tab_file_exists = os.path.exists(tabs_path)
+        tab_stat = _stat_or_none(tabs_path)
+        tab_file_exists = tab_stat is not None
 
         # Always offer to generate tabs
-        if tab_file_exists:
+        if tab_stat is not None:
+            empty_note = (
+                "[yellow]The file is empty.[/yellow]\n\n"
+                if tab_stat.st_size == 0
+                else ""
+            )
             self.console.print(
                 Panel(
                     f"[cyan]Tab file found[/cyan]\n\n"
                     f"Path: {tabs_path}\n\n"
+                    f"{empty_note}"
                     "You can regenerate tabs from MIDI if needed.\n"
                     "[dim]This will overwrite the existing file.[/dim]\n\n"
                     "[dim]Press N to go back and fix MIDI first.[/dim]",
@@ -823,9 +1264,9 @@ class WorkflowOrchestrator:
         if self.auto_approve:
             # Auto-approve: generate only if file missing, otherwise continue with existing
             if not tab_file_exists:
-                self._generate_tabs_from_midi()
+                tab_file_exists = self._generate_tabs_from_midi()
             # Always continue forward in auto-approve mode
-            if os.path.exists(tabs_path):
+            if tab_file_exists:
                 self._validate_midi()
             else:
                 self.session.set_data("skip_tab_video", True)
@@ -836,10 +1277,10 @@ class WorkflowOrchestrator:
             generate_tabs = questionary.confirm(prompt, default=default).ask()
 
             if generate_tabs:
-                self._generate_tabs_from_midi()
+                generated = self._generate_tabs_from_midi()
 
                 # Run validation after generation
-                if os.path.exists(tabs_path):
+                if generated or tab_file_exists:
                     self._validate_midi()
 
                 # Select FPS before video generation
@@ -874,23 +1315,26 @@ class WorkflowOrchestrator:
                         )
                         self.session.transition_to(WorkflowState.MIDI_FIXING)
 
-    def _generate_tabs_from_midi(self) -> None:
+    def _generate_tabs_from_midi(self) -> bool:
         """Generate tab file from MIDI using the tab generator.
 
         Uses the same logic as cli.py generate-tabs command.
+
+        Returns:
+            True if the tab file was written
         """
+        import questionary
         from tab_converter.tab_generator import TabGenerator, TabGeneratorConfig
         from tab_converter.tab_mapper import create_tab_mapper
         from harmonica_pipeline.midi_processor import MidiProcessor
-        from utils.utils import TAB_FILES_DIR
 
         midi_path = self.session.get_data("generated_midi")
-        harmonica_key = self.session.config.get("key", "C")
+        harmonica_key = self._harmonica_key
         output_path = self.session.input_tabs
 
         if not midi_path or not os.path.exists(midi_path):
             self.console.print("[red]✗ Cannot generate tabs: MIDI file not found[/red]")
-            return
+            return False
 
         self.console.print(
             Panel(
@@ -902,14 +1346,12 @@ class WorkflowOrchestrator:
             )
         )
 
+        written = False
         try:
-            # Load MIDI and convert to note events
+            # Stream note events from the MIDI straight into the tab mapper
             processor = MidiProcessor(midi_path)
-            note_events = processor.load_note_events()
-
-            # Convert to tabs using factory function
             mapper = create_tab_mapper(harmonica_key, output_path="temp")
-            tabs = mapper.note_events_to_tabs(note_events)
+            tabs = mapper.note_events_to_tabs(processor.iter_note_events())
 
             # Generate tab file with default formatting
             config = TabGeneratorConfig(
@@ -919,10 +1361,12 @@ class WorkflowOrchestrator:
             generator = TabGenerator(config)
             content = generator.generate(tabs)
 
-            # Write to file
+            # Encode once and write bytes, bypassing the text layer's
+            # incremental encoder and newline translation
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, "w") as f:
-                f.write(content)
+            with open(output_path, "wb", buffering=TAB_WRITE_BUFFER_SIZE) as f:
+                f.write(content.encode("utf-8"))
+            written = True
 
             self.console.print(f"[green]✓ Generated tabs: {output_path}[/green]")
 
@@ -942,6 +1386,8 @@ class WorkflowOrchestrator:
         except Exception as e:
             self.console.print(f"[red]✗ Tab generation failed: {e}[/red]")
 
+        return written
+
     def _check_octave_warning(self, tabs) -> None:
         """Check if generated tabs suggest MIDI is in wrong octave.
 
@@ -951,37 +1397,31 @@ class WorkflowOrchestrator:
         if not tabs or not tabs.tabs:
             return
 
-        # Count notes in upper register (holes 7-10, including draws)
-        upper_register = 0
-        middle_register = 0
-        lower_register = 0
-
-        for tab_entry in tabs.tabs:
-            hole = abs(tab_entry.tab)
-            if hole >= 7:
-                upper_register += 1
-            elif hole >= 4:
-                middle_register += 1
-            else:
-                lower_register += 1
+        # Count notes per hole (draws are negative) with C-level iteration
+        hole_counts = Counter(map(abs, map(attrgetter("tab"), tabs.tabs)))
+        upper_register = sum(c for hole, c in hole_counts.items() if hole >= 7)
 
+        # Warn only if more than 60% of notes are in the upper register;
+        # integer comparison so the common no-warning case exits here
         total = len(tabs.tabs)
-        upper_percent = (upper_register / total) * 100 if total > 0 else 0
+        if upper_register * 5 <= total * 3:
+            return
 
-        # If more than 60% of notes are in upper register, warn user
-        if upper_percent > 60:
-            self.console.print(
-                Panel(
-                    f"[yellow]⚠️  Most notes ({upper_percent:.0f}%) are in holes 7-10[/yellow]\n\n"
-                    f"Upper register (7-10): {upper_register} notes\n"
-                    f"Middle register (4-6): {middle_register} notes\n"
-                    f"Lower register (1-3): {lower_register} notes\n\n"
-                    "This often means the MIDI is [bold]one octave too high[/bold].\n\n"
-                    "[cyan]Fix:[/cyan] Transpose the MIDI down 12 semitones in your DAW,\n"
-                    "then regenerate tabs.",
-                    title="🎵 Octave Warning",
-                )
+        middle_register = sum(c for hole, c in hole_counts.items() if 4 <= hole < 7)
+        lower_register = total - upper_register - middle_register
+        upper_percent = upper_register / total * 100
+        self.console.print(
+            Panel(
+                f"[yellow]⚠️  Most notes ({upper_percent:.0f}%) are in holes 7-10[/yellow]\n\n"
+                f"Upper register (7-10): {upper_register} notes\n"
+                f"Middle register (4-6): {middle_register} notes\n"
+                f"Lower register (1-3): {lower_register} notes\n\n"
+                "This often means the MIDI is [bold]one octave too high[/bold].\n\n"
+                "[cyan]Fix:[/cyan] Transpose the MIDI down 12 semitones in your DAW,\n"
+                "then regenerate tabs.",
+                title="🎵 Octave Warning",
             )
+        )
 
     def _step_harmonica_review(self) -> None:
         """Generate harmonica animation and wait for user approval.
@@ -990,73 +1430,42 @@ class WorkflowOrchestrator:
         review it. If not approved, user can regenerate (future: with
         different parameters).
         """
-        from harmonica_pipeline.video_creator import VideoCreator
-        from harmonica_pipeline.video_creator_config import VideoCreatorConfig
-        from harmonica_pipeline.harmonica_key_registry import get_harmonica_config
-        from utils.utils import OUTPUTS_DIR
+        import questionary
 
-        # Get configuration
-        harmonica_key = self.session.config.get("key", "C")
-        harmonica_config = get_harmonica_config(harmonica_key)
-
-        # Get paths from session
-        video_path = self.session.input_video
-        tabs_path = self.session.input_tabs
-        midi_path = self.session.get_data(
-            "generated_midi", f"fixed_midis/{self.session.song_name}_fixed.mid"
-        )
-        harmonica_path = os.path.join("harmonica-models", harmonica_config.model_image)
-
-        # Output paths (.mp4 for chromakey default, .mov for alpha mode)
-        use_alpha = self.session.config.get("use_alpha", False)
-        harmonica_ext = ".mov" if use_alpha else ".mp4"
-        output_video = f"{self.session.song_name}_harmonica{harmonica_ext}"
-        output_video_path = os.path.join(OUTPUTS_DIR, output_video)
-
-        # Get FPS from session (selected after MIDI fixing)
-        fps = self.session.get_data("fps", 15)
+        # Output path (.mp4 for chromakey default, .mov for alpha mode)
+        output_video_path = self._paths.harmonica_video
+        config = self._build_video_config("harmonica", self.project_temp_dir)
 
         self.console.print(
             Panel(
                 f"[cyan]Generating harmonica animation[/cyan]\n\n"
-                f"Video: {video_path}\n"
-                f"MIDI: {midi_path}\n"
-                f"Key: {harmonica_key}\n"
-                f"FPS: {fps}\n"
+                f"Video: {config.video_path}\n"
+                f"MIDI: {config.midi_path}\n"
+                f"Key: {config.harmonica_key}\n"
+                f"FPS: {config.fps}\n"
                 f"Output: {output_video_path}\n\n"
                 "[dim]This may take 1-2 minutes...[/dim]",
                 title="Harmonica Video Generation",
             )
         )
 
-        # Create configuration (using project-specific temp directory)
-        from harmonica_pipeline.video_creator_config import ChromaKeyConfig
-
-        chroma_key_config = ChromaKeyConfig(
-            bg_color=self.session.config.get("bg_color", "#00FF00"),
-            crf=self.session.config.get("crf", 23),
-        )
-        config = VideoCreatorConfig(
-            video_path=video_path,
-            tabs_path=tabs_path,
-            harmonica_path=harmonica_path,
-            midi_path=midi_path,
-            output_video_path=output_video_path,
-            tabs_output_path=None,  # No tabs yet
-            produce_tabs=False,
-            produce_full_tab_video=False,
-            only_full_tab_video=False,
-            harmonica_key=harmonica_key,
-            tab_page_buffer=self.session.config.get("tab_buffer", 0.1),
-            fps=fps,
-            temp_dir=self.project_temp_dir,
-            use_alpha=use_alpha,
-            chroma_key=chroma_key_config,
-        )
+        # Nothing gates the tab video on harmonica approval in auto-approve
+        # mode, so render it concurrently in a worker process
+        if (
+            self.auto_approve
+            and not self.session.get_data("skip_tab_video")
+            and os.path.exists(config.tabs_path)
+        ):
+            self._start_tab_video_render()
 
         # Generate harmonica video
-        creator = VideoCreator(config)
-        creator.create(create_harmonica=True, create_tabs=False)
+        try:
+            creator = self._harmonica_video_creator(config)
+            creator.create(create_harmonica=True, create_tabs=False)
+        except BaseException:
+            # Failed or interrupted: don't leave the tab worker behind
+            self._cancel_tab_video_render()
+            raise
 
         self.console.print(
             f"[green]✓ Harmonica video created: {output_video_path}[/green]"
@@ -1065,8 +1474,8 @@ class WorkflowOrchestrator:
         # Save output path to session
         self.session.set_data("harmonica_video", output_video_path)
 
-        # Open outputs folder for user to review the video
-        self._open_folder(OUTPUTS_DIR)
+        # Play the video so the user can review it
+        self._open_file(output_video_path)
 
         # Wait for user approval
         if (
@@ -1087,12 +1496,41 @@ class WorkflowOrchestrator:
             self.session.set_data("fps", None)
             self.session.transition_to(WorkflowState.MIDI_FIXING)
 
+    def _harmonica_video_creator(self, config):
+        """Get a VideoCreator for the harmonica render, reusing the last one.
+
+        Building a VideoCreator loads the harmonica model image and parses the
+        tab file. On a review retry with an identical config and an unchanged
+        tab file the previous creator is reused; create() re-extracts audio
+        and reloads the MIDI on every call, so MIDI edits are still picked up.
+
+        Args:
+            config: VideoCreatorConfig for the harmonica render
+
+        Returns:
+            VideoCreator for config
+        """
+        from harmonica_pipeline.video_creator import VideoCreator
+
+        tabs_stat = _stat_or_none(config.tabs_path)
+        tabs_mtime = tabs_stat.st_mtime if tabs_stat is not None else None
+        if self._harmonica_creator is not None:
+            cached_config, cached_mtime, creator = self._harmonica_creator
+            if cached_config == config and cached_mtime == tabs_mtime:
+                return creator
+
+        creator = VideoCreator(config)
+        self._harmonica_creator = (config, tabs_mtime, creator)
+        return creator
+
     def _step_tab_video_review(self) -> None:
         """Generate full tab video and wait for user approval.
 
         Generates the full tab page animation video (compositor) and allows
         user to review it. If not approved, user can go back to MIDI fixing.
         """
+        import questionary
+
         # Check if tab video should be skipped (no tab file)
         if self.session.get_data("skip_tab_video"):
             self.console.print(
@@ -1101,88 +1539,45 @@ class WorkflowOrchestrator:
             self.session.transition_to(WorkflowState.FINALIZATION)
             return
 
-        from harmonica_pipeline.video_creator import VideoCreator
-        from harmonica_pipeline.video_creator_config import VideoCreatorConfig
-        from harmonica_pipeline.harmonica_key_registry import get_harmonica_config
-        from utils.utils import OUTPUTS_DIR
-
-        # Get configuration
-        harmonica_key = self.session.config.get("key", "C")
-        harmonica_config = get_harmonica_config(harmonica_key)
-
-        # Get paths from session
-        video_path = self.session.input_video
-        tabs_path = self.session.input_tabs
-        midi_path = self.session.get_data(
-            "generated_midi", f"fixed_midis/{self.session.song_name}_fixed.mid"
-        )
-        harmonica_path = os.path.join("harmonica-models", harmonica_config.model_image)
-
-        # Output paths (video_creator will rename _tabs.mov to _full_tabs.mov or .mp4)
-        use_alpha = self.session.config.get("use_alpha", False)
-        output_video = f"{self.session.song_name}_tabs.mov"
-        output_video_path = os.path.join(OUTPUTS_DIR, output_video)
         # In chromakey mode the final output is .mp4; in alpha mode it's .mov
-        full_tabs_ext = ".mov" if use_alpha else ".mp4"
-        final_output_path = os.path.join(
-            OUTPUTS_DIR, f"{self.session.song_name}_full_tabs{full_tabs_ext}"
-        )
-
-        # Get FPS from session (selected after MIDI fixing)
-        fps = self.session.get_data("fps", 15)
+        final_output_path = self._paths.tab_video
 
-        self.console.print(
-            Panel(
-                f"[cyan]Generating full tab video[/cyan]\n\n"
-                f"Tabs: {tabs_path}\n"
-                f"MIDI: {midi_path}\n"
-                f"FPS: {fps}\n"
-                f"Output: {output_video_path}\n\n"
-                "[dim]This may take 2-3 minutes...[/dim]",
-                title="Tab Video Generation",
-            )
-        )
+        if self._tab_video_render is not None:
+            # Already rendering in parallel with the harmonica video
+            render, self._tab_video_render = self._tab_video_render, None
+            self.console.print("[dim]Waiting for parallel tab video render...[/dim]")
+            try:
+                render.result()
+            finally:
+                self._cancel_tab_video_render()
+        else:
+            from harmonica_pipeline.video_creator import VideoCreator
 
-        # Create configuration (using project-specific temp directory)
-        # Note: output_video_path is required by config validation even for tab-only
-        from harmonica_pipeline.video_creator_config import ChromaKeyConfig
+            config = self._build_video_config("tabs", self.project_temp_dir)
 
-        chroma_key_config = ChromaKeyConfig(
-            bg_color=self.session.config.get("bg_color", "#00FF00"),
-            crf=self.session.config.get("crf", 23),
-        )
-        dummy_harmonica_path = os.path.join(
-            OUTPUTS_DIR, f"{self.session.song_name}_dummy.mov"
-        )
-        config = VideoCreatorConfig(
-            video_path=video_path,
-            tabs_path=tabs_path,
-            harmonica_path=harmonica_path,
-            midi_path=midi_path,
-            output_video_path=dummy_harmonica_path,  # Required but won't be created
-            tabs_output_path=output_video_path,
-            produce_tabs=False,  # Not creating individual page videos
-            produce_full_tab_video=True,  # Create full compositor video
-            only_full_tab_video=True,  # Skip individual pages
-            harmonica_key=harmonica_key,
-            tab_page_buffer=self.session.config.get("tab_buffer", 0.1),
-            fps=fps,
-            temp_dir=self.project_temp_dir,
-            use_alpha=use_alpha,
-            chroma_key=chroma_key_config,
-        )
+            self.console.print(
+                Panel(
+                    f"[cyan]Generating full tab video[/cyan]\n\n"
+                    f"Tabs: {config.tabs_path}\n"
+                    f"MIDI: {config.midi_path}\n"
+                    f"FPS: {config.fps}\n"
+                    f"Output: {config.tabs_output_path}\n\n"
+                    "[dim]This may take 2-3 minutes...[/dim]",
+                    title="Tab Video Generation",
+                )
+            )
 
-        # Generate tab video
-        creator = VideoCreator(config)
-        creator.create(create_harmonica=False, create_tabs=True)
+            # Generate tab video
+            creator = VideoCreator(config)
+            creator.create(create_harmonica=False, create_tabs=True)
 
         self.console.print(f"[green]✓ Tab video created: {final_output_path}[/green]")
 
         # Save output path to session (the actual _full_tabs.mov file)
         self.session.set_data("tab_video", final_output_path)
 
-        # Open outputs folder for user to review the video
-        self._open_folder(OUTPUTS_DIR)
+        # Play the video so the user can review it
+        self._open_file(final_output_path)
 
         # Wait for user approval
         if (
@@ -1211,82 +1606,230 @@ class WorkflowOrchestrator:
                 self.console.print("[yellow]⮌ Regenerating tab video...[/yellow]")
                 self.session.transition_to(WorkflowState.TAB_VIDEO_REVIEW)
 
+    def _build_video_config(self, mode: Literal["harmonica", "tabs"], temp_dir: str):
+        """Build the VideoCreatorConfig for one of the two review renders.
+
+        Both renders share the session inputs, key, FPS and output styling;
+        only the output paths and what to produce differ.
+
+        Args:
+            mode: "harmonica" for the hole animation, "tabs" for the full tab video
+            temp_dir: Temp directory for intermediate render files
+
+        Returns:
+            VideoCreatorConfig for the requested render
+        """
+        from harmonica_pipeline.video_creator_config import (
+            ChromaKeyConfig,
+            VideoCreatorConfig,
+        )
+
+        if mode == "harmonica":
+            outputs = dict(
+                output_video_path=self._paths.harmonica_video,
+                tabs_output_path=None,  # No tabs yet
+                produce_tabs=False,
+                produce_full_tab_video=False,
+                only_full_tab_video=False,
+            )
+        else:
+            outputs = dict(
+                # Required by config validation but won't be created
+                output_video_path=os.path.join(
+                    OUTPUTS_DIR, f"{self.session.song_name}_dummy.mov"
+                ),
+                # video_creator will rename _tabs.mov to _full_tabs.mov or .mp4
+                tabs_output_path=os.path.join(
+                    OUTPUTS_DIR, f"{self.session.song_name}_tabs.mov"
+                ),
+                produce_tabs=False,  # Not creating individual page videos
+                produce_full_tab_video=True,  # Create full compositor video
+                only_full_tab_video=True,  # Skip individual pages
+            )
+
+        chroma_key_config = ChromaKeyConfig(
+            bg_color=self.session.config.get("bg_color", "#00FF00"),
+            crf=self.session.config.get("crf", 23),
+        )
+        return VideoCreatorConfig(
+            video_path=self.session.input_video,
+            tabs_path=self.session.input_tabs,
+            harmonica_path=self._harmonica_model_path,
+            midi_path=self.session.get_data("generated_midi", self._paths.fixed_midi),
+            harmonica_key=self._harmonica_key,
+            tab_page_buffer=self.session.config.get("tab_buffer", 0.1),
+            # FPS is selected after MIDI fixing, so read it at render time
+            fps=self.session.get_data("fps", 15),
+            temp_dir=temp_dir,
+            use_alpha=self.session.config.get("use_alpha", False),
+            chroma_key=chroma_key_config,
+            **outputs,
+        )
+
+    def _start_tab_video_render(self) -> None:
+        """Start rendering the full tab video in a worker process.
+
+        Uses its own temp directory so intermediate files (e.g. the extracted
+        audio) don't collide with the harmonica render running alongside it.
+        _step_tab_video_review waits for the result.
+        """
+        temp_dir = os.path.join(self.project_temp_dir, "tab_video", "")
+        os.makedirs(temp_dir, exist_ok=True)
+        config = self._build_video_config("tabs", temp_dir)
+
+        self.console.print(
+            f"[dim]Rendering tab video in parallel: {config.tabs_output_path}[/dim]"
+        )
+        # spawn: the renderers use matplotlib, which must not inherit this
+        # process's state through fork()
+        executor = ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        )
+        self._tab_video_render = executor.submit(_render_video, config, False, True)
+        # Not shut down here: a later shutdown(wait=True) would then return
+        # without waiting. The tab step or _cancel_tab_video_render does it.
+        self._tab_video_executor = executor
+
+    def _cancel_tab_video_render(self) -> None:
+        """Shut down the tab video worker started by _start_tab_video_render.
+
+        A job that has not started yet is cancelled; one that is already
+        running is waited for, so no worker process outlives the step.
+        """
+        executor, self._tab_video_executor = self._tab_video_executor, None
+        render, self._tab_video_render = self._tab_video_render, None
+        if executor is None:
+            return
+        if render is not None and not render.cancel():
+            self.console.print("[dim]Waiting for the tab video render to stop...[/dim]")
+        executor.shutdown(wait=True, cancel_futures=True)
+
     def _step_finalization(self) -> None:
         """Finalize workflow - cleanup, ZIP, archive.
 
         Creates final output package and archives source files.
         """
         import shutil
-        from pathlib import Path
 
-        self.console.print(
-            Panel(
-                "[cyan]Finalizing workflow...[/cyan]\n"
-                "- Creating output ZIP\n"
-                "- Archiving MIDI and tabs\n"
-                "- Session cleanup",
-                title="Finalization",
-            )
-        )
+        self.console.print(_FINALIZATION_PANEL)
 
         # Create output ZIP with both videos
         zip_name = f"{self.session.song_name}_{self.session.config.get('key', 'C')}"
-        zip_path = os.path.join("outputs", zip_name)
+        zip_file = ZIP_OUTPUT_ROOT / f"{zip_name}.zip"
 
         # Get video paths from session
         harmonica_video = self.session.get_data("harmonica_video")
         tab_video = self.session.get_data("tab_video")
 
-        if harmonica_video or tab_video:
-            self.console.print(f"[dim]Creating ZIP: {zip_path}.zip[/dim]")
-
-            # Create ZIP with only this song's videos
+        # Results are collected and shown in one summary panel at the end
+        results = []
+
+        # Only keep videos that actually exist on disk and have content
+        # (session paths may be stale from a previous run)
+        entries = []
+        for video in (harmonica_video, tab_video):
+            video_stat = _stat_or_none(video) if video else None
+            if video_stat is None or video_stat.st_size == 0:
+                continue
+            entries.append((video, os.path.basename(video)))
+            video_file = Path(video)
+            chroma_video = video_file.with_name(f"{video_file.stem}_chromakey.mp4")
+            if chroma_video.exists():
+                entries.append((str(chroma_video), chroma_video.name))
+
+        if entries:
+            # Create ZIP with only this song's videos. The videos are
+            # already compressed, so entries are stored rather than deflated
             import zipfile
 
-            with zipfile.ZipFile(f"{zip_path}.zip", "w", zipfile.ZIP_DEFLATED) as zf:
-                if harmonica_video and os.path.exists(harmonica_video):
-                    zf.write(harmonica_video, os.path.basename(harmonica_video))
-                    chroma_harmonica = str(
-                        Path(harmonica_video).parent
-                        / f"{Path(harmonica_video).stem}_chromakey.mp4"
-                    )
-                    if os.path.exists(chroma_harmonica):
-                        zf.write(chroma_harmonica, os.path.basename(chroma_harmonica))
-                if tab_video and os.path.exists(tab_video):
-                    zf.write(tab_video, os.path.basename(tab_video))
-                    chroma_tab = str(
-                        Path(tab_video).parent / f"{Path(tab_video).stem}_chromakey.mp4"
-                    )
-                    if os.path.exists(chroma_tab):
-                        zf.write(chroma_tab, os.path.basename(chroma_tab))
-
-            self.console.print(f"[green]✓ Created ZIP: {zip_path}.zip[/green]")
+            # Unbuffered output: each copy chunk goes straight to write()
+            # instead of being memcpy'd through a second file buffer
+            with open(zip_file, "wb", buffering=0) as f:
+                with zipfile.ZipFile(f, "w", zipfile.ZIP_STORED, allowZip64=True) as zf:
+                    for path, arcname in entries:
+                        zinfo = zipfile.ZipInfo.from_file(path, arcname)
+                        zinfo.compress_type = zipfile.ZIP_STORED
+                        force_zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT
+                        with (
+                            open(path, "rb", buffering=0) as src,
+                            zf.open(zinfo, "w", force_zip64=force_zip64) as dest,
+                        ):
+                            shutil.copyfileobj(src, dest, ZIP_COPY_CHUNK_SIZE)
+
+            results.append(f"[green]✓ Created ZIP: {zip_file}[/green]")
+        else:
+            results.append("[dim]No videos to package, skipping ZIP[/dim]")
 
-        # Archive MIDI and tabs to legacy folder
-        legacy_dir = os.path.join("legacy", self.session.song_name)
-        Path(legacy_dir).mkdir(parents=True, exist_ok=True)
+        # Archive MIDI and tabs to legacy folder (cloned where supported)
+        legacy_dir = LEGACY_ROOT / self.session.song_name
+        legacy_dir.mkdir(parents=True, exist_ok=True)
 
         midi_path = self.session.get_data("generated_midi")
         if midi_path and os.path.exists(midi_path):
-            shutil.copy2(
-                midi_path, os.path.join(legacy_dir, os.path.basename(midi_path))
-            )
-            self.console.print(f"[green]✓ Archived MIDI to: {legacy_dir}/[/green]")
+            clone_file(midi_path, str(legacy_dir / os.path.basename(midi_path)))
+            results.append(f"[green]✓ Archived MIDI to: {legacy_dir}/[/green]")
 
         if os.path.exists(self.session.input_tabs):
-            shutil.copy2(
+            clone_file(
                 self.session.input_tabs,
-                os.path.join(legacy_dir, os.path.basename(self.session.input_tabs)),
+                str(legacy_dir / os.path.basename(self.session.input_tabs)),
             )
-            self.console.print(f"[green]✓ Archived tabs to: {legacy_dir}/[/green]")
+            results.append(f"[green]✓ Archived tabs to: {legacy_dir}/[/green]")
 
         # Mark complete
-        self.console.print("[green bold]✓ Workflow finalized![/green bold]")
+        self.console.print(
+            Panel(
+                "\n".join(results),
+                title="[green bold]✓ Workflow finalized![/green bold]",
+            )
+        )
         self.session.transition_to(WorkflowState.COMPLETE)
 
-    def _save_session(self) -> None:
-        """Save current session state to disk."""
-        self.session.save(self.session_file)
+    def _mark_dirty(self) -> None:
+        """Flag the session for saving after a change it does not track.
+
+        Changes made through ``transition_to``/``set_data`` are tracked by the
+        session itself; this is only needed after direct field assignment.
+        """
+        self._session_dirty = True
+
+    def _save_session(self, full: bool = False) -> None:
+        """Save current session state to disk if it has unsaved changes.
+
+        Plain state transitions are appended to the session journal; any
+        other change (or ``full=True``) rewrites the session file, which also
+        folds the journal back in.
+
+        The first save is written synchronously so the session file exists
+        for resuming. Later snapshots are serialized here and handed to the
+        background writer; call ``self._writer.flush()`` where they must be
+        on disk.
+
+        Args:
+            full: Force a full rewrite of the session file
+        """
+        # Review loops that end without a transition or new data save nothing
+        if not (self._session_dirty or self.session.is_dirty()):
+            return
+        if not self._session_written:
+            self.session.save(self.session_file)
+            self._session_written = True
+        elif not full and self.session.can_journal():
+            self._writer.append(
+                WorkflowSession.journal_path(self.session_file),
+                self.session.journal_entry(),
+            )
+            self.session.mark_clean()
+        else:
+            self._writer.write(self.session_file, self.session.to_json_bytes())
+            self._writer.unlink(WorkflowSession.journal_path(self.session_file))
+            self.session.mark_clean()
+        self._session_dirty = False
+
+    def _flush_session(self) -> None:
+        """Save pending changes and wait for the writer to finish."""
+        self._save_session(full=True)
+        self._writer.flush()
 
     def _show_completion_message(self) -> None:
         """Display completion message with output locations."""
@@ -1300,8 +1843,10 @@ class WorkflowOrchestrator:
             )
         )
 
-        # Clean up session file
-        self.session.delete(self.session_file)
+        # Clean up the session file and journal; queued behind any pending
+        # snapshot writes and flushed when run() returns
+        self._writer.unlink(self.session_file)
+        self._writer.unlink(WorkflowSession.journal_path(self.session_file))
 
     def _show_error_message(self) -> None:
         """Display error message with recovery instructions."""
@@ -5,12 +5,50 @@ after interruptions or crashes.
 """
 
 import json
-import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional, Set
+
+from interactive_workflow.async_writer import write_file_atomic
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Fields that can be persisted as a journal line instead of a full rewrite
+JOURNAL_FIELDS = frozenset({"state", "updated_at"})
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO 8601 string (session timestamp format)."""
+    return datetime.now().isoformat()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON (orjson's error is a
+            subclass)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class WorkflowState(Enum):
@@ -41,7 +79,48 @@ class WorkflowState(Enum):
     ERROR = "error"
 
 
-@dataclass
+# Direct value -> member lookup (skips EnumMeta.__call__ on every load)
+_STATE_BY_VALUE: Dict[str, WorkflowState] = {
+    state.value: state for state in WorkflowState
+}
+
+# Progress percentage shown for each state
+_PROGRESS: Dict[WorkflowState, int] = {
+    WorkflowState.INIT: 0,
+    WorkflowState.STEM_SELECTION: 10,
+    WorkflowState.MIDI_GENERATION: 25,
+    WorkflowState.MIDI_FIXING: 35,
+    WorkflowState.TAB_GENERATION: 45,
+    WorkflowState.HARMONICA_REVIEW: 55,
+    WorkflowState.TAB_VIDEO_REVIEW: 75,
+    WorkflowState.FINALIZATION: 90,
+    WorkflowState.COMPLETE: 100,
+    WorkflowState.ERROR: 0,  # Error resets progress
+}
+
+
+# States each state may move to. ERROR is reachable from anywhere; COMPLETE
+# and ERROR are final otherwise (an errored workflow must restart)
+_ALLOWED_TRANSITIONS: Dict[WorkflowState, FrozenSet[WorkflowState]] = {
+    state: frozenset(WorkflowState) for state in WorkflowState
+}
+_ALLOWED_TRANSITIONS[WorkflowState.COMPLETE] = frozenset({WorkflowState.ERROR})
+_ALLOWED_TRANSITIONS[WorkflowState.ERROR] = frozenset({WorkflowState.ERROR})
+
+
+def _state_from_value(value: str) -> WorkflowState:
+    """Resolve a stored state string to its WorkflowState.
+
+    Raises:
+        ValueError: If value is not a known state
+    """
+    try:
+        return _STATE_BY_VALUE[value]
+    except KeyError:
+        raise ValueError(f"{value!r} is not a valid WorkflowState") from None
+
+
+@dataclass(slots=True)
 class WorkflowSession:
     """Workflow session state and data.
 
@@ -65,13 +144,19 @@ class WorkflowSession:
     input_tabs: str
     config: Dict[str, Any] = field(default_factory=dict)
     data: Dict[str, Any] = field(default_factory=dict)
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = field(default_factory=_now_iso)
+    # Top-level fields changed since the last save (not persisted)
+    _dirty: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    # Session file last written by save() (not persisted)
+    _saved_to: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Convert state to WorkflowState enum if needed."""
         if isinstance(self.state, str):
-            self.state = WorkflowState(self.state)
+            self.state = _state_from_value(self.state)
 
     def transition_to(self, new_state: WorkflowState) -> None:
         """Transition to a new workflow state.
@@ -82,23 +167,15 @@ class WorkflowSession:
         Raises:
             ValueError: If transition is invalid
         """
-        # Validate state transition (basic validation)
-        if new_state == WorkflowState.ERROR:
-            # Can always transition to ERROR
-            pass
-        elif self.state == WorkflowState.COMPLETE:
-            # Cannot transition from COMPLETE (except to ERROR)
-            if new_state != WorkflowState.ERROR:
-                raise ValueError(
-                    f"Cannot transition from COMPLETE to {new_state.value}"
-                )
-        elif self.state == WorkflowState.ERROR:
-            # Cannot transition from ERROR (workflow must restart)
-            raise ValueError(f"Cannot transition from ERROR to {new_state.value}")
+        if new_state not in _ALLOWED_TRANSITIONS[self.state]:
+            raise ValueError(
+                f"Cannot transition from {self.state.name} to {new_state.value}"
+            )
 
         # Update state and timestamp
         self.state = new_state
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = _now_iso()
+        self._dirty.update(("state", "updated_at"))
 
     def set_data(self, key: str, value: Any) -> None:
         """Set session data value.
@@ -108,7 +185,8 @@ class WorkflowSession:
             value: Data value (must be JSON-serializable)
         """
         self.data[key] = value
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = _now_iso()
+        self._dirty.update(("data", "updated_at"))
 
     def get_data(self, key: str, default: Any = None) -> Any:
         """Get session data value.
@@ -125,18 +203,39 @@ class WorkflowSession:
     def save(self, session_file: str) -> None:
         """Save session to JSON file.
 
+        Does nothing if this session was already saved to session_file and
+        has not changed since.
+
         Args:
             session_file: Path to session file
 
         Raises:
             IOError: If file cannot be written
         """
-        # Ensure directory exists
-        session_path = Path(session_file)
-        session_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self._dirty and self._saved_to == session_file:
+            return
+
+        # Serialize up front and write once; the temp-file swap means a crash
+        # never leaves a half-written session. The new file supersedes any
+        # journal
+        payload = self.to_json_bytes()
+        try:
+            write_file_atomic(session_file, payload)
+        except FileNotFoundError:
+            # Session directory missing (first save): create it and retry
+            Path(session_file).parent.mkdir(parents=True, exist_ok=True)
+            write_file_atomic(session_file, payload)
+        self._remove_journal(session_file)
+        self.mark_clean()
+        self._saved_to = session_file
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert session to a JSON-serializable dict.
 
-        # Convert to dict and save
-        session_dict = {
+        Returns:
+            Session fields with the state as its string value
+        """
+        return {
             "state": self.state.value,  # Convert enum to string
             "song_name": self.song_name,
             "input_video": self.input_video,
@@ -147,8 +246,89 @@ class WorkflowSession:
             "updated_at": self.updated_at,
         }
 
-        with open(session_file, "w") as f:
-            json.dump(session_dict, f, indent=2)
+    def to_json_bytes(self) -> bytes:
+        """Serialize session to the on-disk JSON format.
+
+        Returns:
+            Encoded session file contents
+        """
+        return _dumps(self.to_dict(), indent=True)
+
+    def mark_clean(self) -> None:
+        """Forget unsaved changes once a snapshot has been persisted."""
+        self._dirty.clear()
+
+    def is_dirty(self) -> bool:
+        """Check if the session changed since it was last saved.
+
+        Returns:
+            True if transition_to or set_data ran since the last save
+        """
+        return bool(self._dirty)
+
+    def can_journal(self) -> bool:
+        """Check if unsaved changes fit in a journal line.
+
+        Returns:
+            True if only journaled scalar fields (state, timestamp) changed
+        """
+        return bool(self._dirty) and self._dirty <= JOURNAL_FIELDS
+
+    def journal_entry(self) -> bytes:
+        """Serialize unsaved scalar changes as one journal line.
+
+        Appending this line is cheaper than save() for plain state
+        transitions. Lines are replayed by load() and folded back into the
+        main file by the next save().
+
+        Returns:
+            Encoded JSON line (newline-terminated)
+
+        Raises:
+            ValueError: If non-journaled fields have unsaved changes
+        """
+        if not self.can_journal():
+            raise ValueError(f"Cannot journal changes to: {sorted(self._dirty)}")
+
+        patch = {"state": self.state.value, "updated_at": self.updated_at}
+        return _dumps({"t": self.updated_at, "patch": patch}) + b"\n"
+
+    @staticmethod
+    def journal_path(session_file: str) -> str:
+        """Get the journal file path for a session file.
+
+        Args:
+            session_file: Path to session file
+
+        Returns:
+            Path to the sidecar journal
+        """
+        return f"{session_file}.jrnl"
+
+    @classmethod
+    def _remove_journal(cls, session_file: str) -> None:
+        """Delete the session's journal file if present."""
+        Path(cls.journal_path(session_file)).unlink(missing_ok=True)
+
+    @classmethod
+    def _replay_journal(cls, session_file: str, session_dict: Dict[str, Any]) -> None:
+        """Apply journaled patches over a loaded session dict.
+
+        A torn final line (crash mid-append) ends the replay; lines that
+        parse but are not a patch entry are skipped.
+        """
+        try:
+            with open(cls.journal_path(session_file), "rb") as f:
+                for line in f:
+                    try:
+                        entry = _loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    patch = entry.get("patch") if isinstance(entry, dict) else None
+                    if isinstance(patch, dict):
+                        session_dict.update(patch)
+        except FileNotFoundError:
+            pass
 
     @classmethod
     def load(cls, session_file: str) -> Optional["WorkflowSession"]:
@@ -163,23 +343,26 @@ class WorkflowSession:
         Raises:
             ValueError: If session file is corrupted
         """
-        if not os.path.exists(session_file):
+        try:
+            with open(session_file, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
             return None
 
         try:
-            with open(session_file, "r") as f:
-                session_dict = json.load(f)
+            session_dict = _loads(raw)
+            cls._replay_journal(session_file, session_dict)
 
             # Create WorkflowSession from dict
             return cls(
-                state=WorkflowState(session_dict["state"]),
+                state=_state_from_value(session_dict["state"]),
                 song_name=session_dict["song_name"],
                 input_video=session_dict["input_video"],
                 input_tabs=session_dict["input_tabs"],
                 config=session_dict.get("config", {}),
                 data=session_dict.get("data", {}),
-                created_at=session_dict.get("created_at", datetime.now().isoformat()),
-                updated_at=session_dict.get("updated_at", datetime.now().isoformat()),
+                created_at=session_dict.get("created_at") or _now_iso(),
+                updated_at=session_dict.get("updated_at") or _now_iso(),
             )
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             raise ValueError(f"Corrupted session file: {session_file}") from e
@@ -218,8 +401,10 @@ class WorkflowSession:
         Args:
             session_file: Path to session file
         """
-        if os.path.exists(session_file):
-            os.remove(session_file)
+        Path(session_file).unlink(missing_ok=True)
+        self._remove_journal(session_file)
+        if self._saved_to == session_file:
+            self._saved_to = None
 
     def is_complete(self) -> bool:
         """Check if workflow is complete.
@@ -227,7 +412,7 @@ class WorkflowSession:
         Returns:
             True if state is COMPLETE
         """
-        return self.state == WorkflowState.COMPLETE
+        return self.state is WorkflowState.COMPLETE
 
     def is_error(self) -> bool:
         """Check if workflow encountered an error.
@@ -235,7 +420,7 @@ class WorkflowSession:
         Returns:
             True if state is ERROR
         """
-        return self.state == WorkflowState.ERROR
+        return self.state is WorkflowState.ERROR
 
     def get_progress_percentage(self) -> int:
         """Get workflow progress as percentage.
@@ -243,17 +428,4 @@ class WorkflowSession:
         Returns:
             Progress percentage (0-100)
         """
-        # Map states to progress percentages
-        progress_map = {
-            WorkflowState.INIT: 0,
-            WorkflowState.STEM_SELECTION: 10,
-            WorkflowState.MIDI_GENERATION: 25,
-            WorkflowState.MIDI_FIXING: 35,
-            WorkflowState.TAB_GENERATION: 45,
-            WorkflowState.HARMONICA_REVIEW: 55,
-            WorkflowState.TAB_VIDEO_REVIEW: 75,
-            WorkflowState.FINALIZATION: 90,
-            WorkflowState.COMPLETE: 100,
-            WorkflowState.ERROR: 0,  # Error resets progress
-        }
-        return progress_map.get(self.state, 0)
+        return _PROGRESS.get(self.state, 0)
@@ -24,28 +24,30 @@ Output:
 """
 
 import argparse
-import os
 import subprocess
 import sys
+from functools import lru_cache
+from importlib.metadata import version
+from importlib.util import find_spec
 from pathlib import Path
 
 
 def check_dependencies():
-    """Check if required packages are installed."""
-    missing = []
+    """Check if required packages are installed.
 
-    try:
-        import torch
+    Only looks the packages up; importing torch costs seconds, so that is
+    left to the code that actually needs it.
+    """
+    missing = []
 
-        print(f"PyTorch version: {torch.__version__}")
-    except ImportError:
+    if find_spec("torch") is not None:
+        print(f"PyTorch version: {version('torch')}")
+    else:
         missing.append("torch")
 
-    try:
-        import demucs  # noqa: F401
-
+    if find_spec("demucs") is not None:
         print("Demucs installed: Yes")
-    except ImportError:
+    else:
         missing.append("demucs")
 
     if missing:
@@ -59,8 +61,13 @@ def check_dependencies():
     return True
 
 
+@lru_cache(maxsize=1)
 def check_gpu():
-    """Check GPU availability and type."""
+    """Check GPU availability and type.
+
+    Cached so torch and the CUDA/MPS driver are queried (and the status
+    printed) only once per run.
+    """
     try:
         import torch
 
@@ -88,37 +95,6 @@ def check_gpu():
         return None
 
 
-def extract_audio(input_file: str, output_wav: str) -> bool:
-    """Extract audio from video file using ffmpeg."""
-    print(f"\nExtracting audio from: {input_file}")
-
-    cmd = [
-        "ffmpeg",
-        "-y",
-        "-i",
-        input_file,
-        "-vn",  # No video
-        "-acodec",
-        "pcm_s16le",  # WAV format
-        "-ar",
-        "44100",  # 44.1kHz
-        "-ac",
-        "2",  # Stereo
-        output_wav,
-    ]
-
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"FFmpeg error: {result.stderr}")
-            return False
-        print(f"Audio extracted to: {output_wav}")
-        return True
-    except FileNotFoundError:
-        print("FFmpeg not found. Please install ffmpeg.")
-        return False
-
-
 def run_demucs(input_file: str, output_dir: str, model: str = "htdemucs_6s"):
     """
     Run Demucs stem separation.
@@ -224,27 +200,18 @@ def main():
         print("\nError: Please provide an input file")
         sys.exit(1)
 
-    # Check dependencies
-    if not check_dependencies():
-        sys.exit(1)
-
     input_path = Path(args.input_file)
     if not input_path.exists():
         print(f"Error: File not found: {args.input_file}")
         sys.exit(1)
 
-    # If video file, extract audio first
-    video_extensions = {".mp4", ".mov", ".avi", ".mkv", ".m4v", ".webm"}
-    if input_path.suffix.lower() in video_extensions:
-        temp_wav = f"temp/{input_path.stem}_extracted.wav"
-        os.makedirs("temp", exist_ok=True)
-
-        if not extract_audio(str(input_path), temp_wav):
-            sys.exit(1)
+    # Check dependencies
+    if not check_dependencies():
+        sys.exit(1)
 
-        input_file = temp_wav
-    else:
-        input_file = str(input_path)
+    # Demucs decodes audio and video containers itself through ffmpeg, so
+    # video files go straight in without an intermediate WAV on disk
+    input_file = str(input_path)
 
     # Run Demucs
     run_demucs(input_file, args.output, args.model)
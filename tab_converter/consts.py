@@ -5,6 +5,10 @@ The C harmonica is the "master" mapping. All other keys are generated
 by transposing the C mapping by the appropriate number of semitones.
 """
 
+from functools import cache
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
 NOTE_ON_MSG = "note_on"
 NOTE_OFF_MSG = "note_off"
 SET_TEMPO_MSG = "set_tempo"
@@ -98,12 +102,10 @@ def _expand_octaves(base_mapping: dict) -> dict:
     """
     expanded = dict(base_mapping)
     for pitch, hole in base_mapping.items():
-        lower = pitch - 12
-        if lower >= 0 and lower not in expanded:
-            expanded[lower] = hole
-        higher = pitch + 12
-        if higher <= 127 and higher not in expanded:
-            expanded[higher] = hole
+        if pitch >= 12:
+            expanded.setdefault(pitch - 12, hole)
+        if pitch <= 115:
+            expanded.setdefault(pitch + 12, hole)
     return expanded
 
 
@@ -116,9 +118,8 @@ def _expand_octaves_bends(base_bends: dict) -> dict:
     """
     expanded = dict(base_bends)
     for pitch, bend_info in base_bends.items():
-        lower = pitch - 12
-        if lower >= 0 and lower not in expanded:
-            expanded[lower] = bend_info
+        if pitch >= 12:
+            expanded.setdefault(pitch - 12, bend_info)
     return expanded
 
 
@@ -127,79 +128,40 @@ def _expand_octaves_bends(base_bends: dict) -> dict:
 # =============================================================================
 
 
-def _generate_key_mapping(key: str) -> dict:
-    """Generate the full MIDI mapping for a harmonica key."""
+@cache
+def _generate_key_mapping(key: str) -> Mapping[int, int]:
+    """Generate the full MIDI mapping for a harmonica key.
+
+    Cached and shared, so the result is returned as a read-only view.
+    """
     offset = KEY_OFFSETS[key]
     transposed = _transpose_mapping(_C_HARMONICA_NOTES, offset)
-    return _expand_octaves(transposed)
+    return MappingProxyType(_expand_octaves(transposed))
+
 
+@cache
+def _generate_bend_mapping(key: str) -> Mapping[int, Tuple[int, str]]:
+    """Generate the bend mapping for a harmonica key.
 
-def _generate_bend_mapping(key: str) -> dict:
-    """Generate the bend mapping for a harmonica key."""
+    Cached and shared, so the result is returned as a read-only view.
+    """
     offset = KEY_OFFSETS[key]
     transposed = _transpose_bend_mapping(_C_HARMONICA_BENDS, offset)
-    return _expand_octaves_bends(transposed)
-
-
-# Generate all mappings
-C_HARMONICA_MAPPING = _generate_key_mapping("C")
-CS_HARMONICA_MAPPING = _generate_key_mapping("C#")
-D_HARMONICA_MAPPING = _generate_key_mapping("D")
-EB_HARMONICA_MAPPING = _generate_key_mapping("EB")
-E_HARMONICA_MAPPING = _generate_key_mapping("E")
-F_HARMONICA_MAPPING = _generate_key_mapping("F")
-FS_HARMONICA_MAPPING = _generate_key_mapping("F#")
-G_HARMONICA_MAPPING = _generate_key_mapping("G")
-AB_HARMONICA_MAPPING = _generate_key_mapping("AB")
-A_HARMONICA_MAPPING = _generate_key_mapping("A")
-BB_HARMONICA_MAPPING = _generate_key_mapping("BB")
-B_HARMONICA_MAPPING = _generate_key_mapping("B")
-
-# Generate all bend mappings
-C_HARMONICA_BENDS = _generate_bend_mapping("C")
-CS_HARMONICA_BENDS = _generate_bend_mapping("C#")
-D_HARMONICA_BENDS = _generate_bend_mapping("D")
-EB_HARMONICA_BENDS = _generate_bend_mapping("EB")
-E_HARMONICA_BENDS = _generate_bend_mapping("E")
-F_HARMONICA_BENDS = _generate_bend_mapping("F")
-FS_HARMONICA_BENDS = _generate_bend_mapping("F#")
-G_HARMONICA_BENDS = _generate_bend_mapping("G")
-AB_HARMONICA_BENDS = _generate_bend_mapping("AB")
-A_HARMONICA_BENDS = _generate_bend_mapping("A")
-BB_HARMONICA_BENDS = _generate_bend_mapping("BB")
-B_HARMONICA_BENDS = _generate_bend_mapping("B")
+    return MappingProxyType(_expand_octaves_bends(transposed))
 
 
 # =============================================================================
 # LOOKUP DICTIONARIES
 # =============================================================================
 
-HARMONICA_MAPPINGS = {
-    "C": C_HARMONICA_MAPPING,
-    "C#": CS_HARMONICA_MAPPING,
-    "D": D_HARMONICA_MAPPING,
-    "EB": EB_HARMONICA_MAPPING,
-    "E": E_HARMONICA_MAPPING,
-    "F": F_HARMONICA_MAPPING,
-    "F#": FS_HARMONICA_MAPPING,
-    "G": G_HARMONICA_MAPPING,
-    "AB": AB_HARMONICA_MAPPING,
-    "A": A_HARMONICA_MAPPING,
-    "BB": BB_HARMONICA_MAPPING,
-    "B": B_HARMONICA_MAPPING,
-}
-
-HARMONICA_BEND_MAPPINGS = {
-    "C": C_HARMONICA_BENDS,
-    "C#": CS_HARMONICA_BENDS,
-    "D": D_HARMONICA_BENDS,
-    "EB": EB_HARMONICA_BENDS,
-    "E": E_HARMONICA_BENDS,
-    "F": F_HARMONICA_BENDS,
-    "F#": FS_HARMONICA_BENDS,
-    "G": G_HARMONICA_BENDS,
-    "AB": AB_HARMONICA_BENDS,
-    "A": A_HARMONICA_BENDS,
-    "BB": BB_HARMONICA_BENDS,
-    "B": B_HARMONICA_BENDS,
-}
+# Read-only views: these are imported widely and must not be mutated in place
+HARMONICA_MAPPINGS = MappingProxyType(
+    {key: _generate_key_mapping(key) for key in KEY_OFFSETS}
+)
+HARMONICA_BEND_MAPPINGS = MappingProxyType(
+    {key: _generate_bend_mapping(key) for key in KEY_OFFSETS}
+)
+
+# C harmonica (the master mapping) under its historical names
+C_HARMONICA_MAPPING = HARMONICA_MAPPINGS["C"]
+C_HARMONICA_BENDS = HARMONICA_BEND_MAPPINGS["C"]
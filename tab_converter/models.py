@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import NamedTuple, List
 
 
-@dataclass
+@dataclass(slots=True)
 class TabEntry:
     tab: int
     time: float
@@ -12,7 +12,7 @@ class TabEntry:
     bend_notation: str = ""  # Original bend notation: "'", "''", "*", or "\u2019"
 
 
-@dataclass
+@dataclass(slots=True)
 class Tabs:
     tabs: List[TabEntry]
 
@@ -6,7 +6,8 @@ chord detection, line breaks, and page breaks based on timing.
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
+from operator import attrgetter
+from typing import List, Optional, Tuple
 
 from tab_converter.models import TabEntry, Tabs
 
@@ -64,8 +65,9 @@ class TabGenerator:
         if not tabs.tabs:
             raise TabGeneratorError("No tabs to generate")
 
-        # Sort tabs by time
-        sorted_tabs = sorted(tabs.tabs, key=lambda t: t.time)
+        # Sort tabs by time. TabMapper output is already sorted, which
+        # Timsort detects in one linear pass; the caller's list is untouched
+        sorted_tabs = sorted(tabs.tabs, key=attrgetter("time"))
 
         # Group into chords (simultaneous notes)
         chords = self._group_into_chords(sorted_tabs)
@@ -76,7 +78,9 @@ class TabGenerator:
         # Format as text
         return self._format_pages(pages)
 
-    def _group_into_chords(self, tabs: List[TabEntry]) -> List[List[TabEntry]]:
+    def _group_into_chords(
+        self, tabs: List[TabEntry]
+    ) -> List[Tuple[List[TabEntry], float]]:
         """
         Group simultaneous notes into chords.
 
@@ -84,38 +88,43 @@ class TabGenerator:
             tabs: Sorted list of TabEntry objects
 
         Returns:
-            List of chords (each chord is a list of TabEntry)
+            List of (chord, chord_end) pairs, where chord is a list of
+            TabEntry and chord_end is the latest end time of its notes
         """
         if not tabs:
             return []
 
-        chords: List[List[TabEntry]] = []
+        tolerance = self.config.chord_time_tolerance
+        chords: List[Tuple[List[TabEntry], float]] = []
         current_chord: List[TabEntry] = [tabs[0]]
+        chord_end = tabs[0].time + tabs[0].duration
 
         for tab in tabs[1:]:
             # Check if this note is simultaneous with current chord
             time_diff = abs(tab.time - current_chord[0].time)
 
-            if time_diff <= self.config.chord_time_tolerance:
+            if time_diff <= tolerance:
                 current_chord.append(tab)
+                chord_end = max(chord_end, tab.time + tab.duration)
             else:
                 # Save current chord, start new one
-                chords.append(current_chord)
+                chords.append((current_chord, chord_end))
                 current_chord = [tab]
+                chord_end = tab.time + tab.duration
 
         # Don't forget the last chord
-        chords.append(current_chord)
+        chords.append((current_chord, chord_end))
 
         return chords
 
     def _split_into_pages(
-        self, chords: List[List[TabEntry]]
+        self, chords: List[Tuple[List[TabEntry], float]]
     ) -> List[List[List[List[TabEntry]]]]:
         """
         Split chords into pages and lines.
 
         Args:
-            chords: List of chords
+            chords: List of (chord, chord_end) pairs from _group_into_chords
 
         Returns:
             Nested structure: pages -> lines -> chords
@@ -123,23 +132,27 @@ class TabGenerator:
         if not chords:
             return []
 
+        # Thresholds are fixed for the whole pass
+        config = self.config
+        page_gap = config.page_gap_threshold
+        line_gap = config.line_gap_threshold
+        notes_per_page = config.notes_per_page
+        notes_per_line = config.notes_per_line
+
         pages: List[List[List[List[TabEntry]]]] = []
         current_page: List[List[List[TabEntry]]] = []
         current_line: List[List[TabEntry]] = []
         page_chord_count = 0
         prev_chord_end = 0.0
 
-        for chord in chords:
+        for chord, chord_end in chords:
             chord_time = chord[0].time
-            chord_end = max(t.time + t.duration for t in chord)
 
             # Calculate gap from previous chord
             gap = chord_time - prev_chord_end if prev_chord_end > 0 else 0
 
             # Check for page break (long pause or max notes)
-            if gap >= self.config.page_gap_threshold or (
-                page_chord_count >= self.config.notes_per_page and current_line
-            ):
+            if gap >= page_gap or (page_chord_count >= notes_per_page and current_line):
                 # Save current line to page
                 if current_line:
                     current_page.append(current_line)
@@ -152,10 +165,7 @@ class TabGenerator:
                     page_chord_count = 0
 
             # Check for line break (medium pause or max notes per line)
-            elif (
-                gap >= self.config.line_gap_threshold
-                or len(current_line) >= self.config.notes_per_line
-            ):
+            elif gap >= line_gap or len(current_line) >= notes_per_line:
                 if current_line:
                     current_page.append(current_line)
                     current_line = []
@@ -183,20 +193,15 @@ class TabGenerator:
         Returns:
             Formatted tab file content
         """
+        format_chord = self._format_chord
         lines = []
 
         for page_num, page in enumerate(pages, 1):
-            lines.append(f"page {page_num}:")
-
-            for line in page:
-                formatted_chords = []
-                for chord in line:
-                    formatted_chords.append(self._format_chord(chord))
-                lines.append(" ".join(formatted_chords))
-
-            # Add blank line between pages (except after last)
-            if page_num < len(pages):
+            # Blank line between pages (except before the first)
+            if page_num > 1:
                 lines.append("")
+            lines.append(f"page {page_num}:")
+            lines.extend(" ".join(map(format_chord, line)) for line in page)
 
         return "\n".join(lines)
 
@@ -213,38 +218,20 @@ class TabGenerator:
         if not chord:
             return ""
 
+        # Single notes (by far the most common case): "6", "-5", "-4'"
+        if len(chord) == 1:
+            note = chord[0]
+            if note.is_bend:
+                return str(note.tab) + (note.bend_notation or "'")
+            return str(note.tab)
+
         # Sort by absolute hole number for consistent output
         sorted_notes = sorted(chord, key=lambda t: abs(t.tab))
-
-        # Check if all notes are same direction (blow or draw)
-        is_draw = sorted_notes[0].tab < 0
-
-        # Build chord string
-        parts = []
-        for note in sorted_notes:
-            hole = abs(note.tab)
-            if note.tab < 0:
-                parts.append(f"-{hole}")
-            else:
-                parts.append(str(hole))
+        holes = "".join(str(abs(n.tab)) for n in sorted_notes)
 
         # For chords, join without spaces
         # e.g., blow chord: "56" (holes 5 and 6)
-        # e.g., draw chord: "-45" (draw 4 and 5)
-        if len(parts) == 1:
-            result = parts[0]
-        else:
-            # Multi-note chord
-            if is_draw:
-                # Draw chord: single minus prefix + all hole numbers: -456
-                result = "-" + "".join(str(abs(n.tab)) for n in sorted_notes)
-            else:
-                # Blow chord: 456 (just concatenate digits)
-                result = "".join(str(abs(n.tab)) for n in sorted_notes)
-
-        # Add bend notation if present
-        if len(chord) == 1 and chord[0].is_bend:
-            bend = chord[0].bend_notation or "'"
-            result += bend
-
-        return result
+        # e.g., draw chord: "-45" (draw 4 and 5), a single minus prefix
+        if sorted_notes[0].tab < 0:
+            return "-" + holes
+        return holes
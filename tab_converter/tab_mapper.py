@@ -6,8 +6,9 @@ using a configurable harmonica mapping.
 """
 
 import json
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Mapping, Tuple
 
 from tab_converter.models import TabEntry, Tabs, NoteEvent
 
@@ -28,9 +29,9 @@ class TabMapper:
 
     def __init__(
         self,
-        harmonica_mapping: Dict[int, int],
+        harmonica_mapping: Mapping[int, int],
         json_outputs_path: str,
-        bend_mapping: Dict[int, Tuple[int, str]] | None = None,
+        bend_mapping: Mapping[int, Tuple[int, str]] | None = None,
     ):
         """
         Initialize tab mapper.
@@ -45,15 +46,28 @@ class TabMapper:
 
         self._mapping = harmonica_mapping
         self._bend_mapping = bend_mapping or {}
+
+        # Single pitch -> (hole, is_bend, bend_notation) table; pure notes
+        # take priority, bends only fill pitches with no pure note
+        self._resolve: Dict[int, Tuple[int, bool, str]] = {
+            pitch: (hole, True, notation)
+            for pitch, (hole, notation) in self._bend_mapping.items()
+        }
+        self._resolve.update(
+            (pitch, (hole, False, "")) for pitch, hole in harmonica_mapping.items()
+        )
         self._json_outputs_path = Path(json_outputs_path)
         self._json_outputs_path.mkdir(parents=True, exist_ok=True)
 
-    def note_events_to_tabs(self, raw_events: List[Tuple]) -> Tabs:
+    def note_events_to_tabs(self, raw_events: Iterable[Tuple]) -> Tabs:
         """
         Convert MIDI note events to harmonica tabs.
 
+        Events are consumed in a single pass, so a generator such as
+        MidiProcessor.iter_note_events() can be passed directly.
+
         Args:
-            raw_events: List of tuples (start, end, pitch, velocity, confidence)
+            raw_events: Iterable of tuples (start, end, pitch, velocity, confidence)
 
         Returns:
             Tabs object containing sorted TabEntry objects
@@ -61,13 +75,12 @@ class TabMapper:
         Raises:
             TabMapperError: If no valid tabs could be created
         """
-        if not raw_events:
-            raise TabMapperError("No note events provided")
-
         tab_entries = []
         skipped_notes = 0
+        event_count = 0
 
         for event_tuple in raw_events:
+            event_count += 1
             try:
                 tab_entry = self._convert_note_event_to_tab(event_tuple)
                 if tab_entry:
@@ -78,6 +91,9 @@ class TabMapper:
                 print(f"⚠️  Warning: Skipping invalid note event {event_tuple}: {e}")
                 skipped_notes += 1
 
+        if not event_count:
+            raise TabMapperError("No note events provided")
+
         if not tab_entries:
             raise TabMapperError(
                 "No valid harmonica tabs could be created from note events"
@@ -85,7 +101,7 @@ class TabMapper:
 
         # Create and sort tabs by time
         tabs = Tabs(tab_entries)
-        tabs.tabs.sort(key=lambda entry: entry.time)
+        tabs.tabs.sort(key=attrgetter("time"))
 
         print(f"🎼 Mapped {len(tab_entries)} valid tabs, skipped {skipped_notes} notes")
         return tabs
@@ -102,22 +118,12 @@ class TabMapper:
         """
         event = NoteEvent(*event_tuple)
 
-        # Check regular mapping first (pure notes take priority over bends)
-        # Only use bend if the pitch is NOT available as a pure note
-        is_bend = False
-        bend_notation = ""
-        tab_hole = None
-
-        if event.pitch in self._mapping:
-            # Pure note available - use it
-            tab_hole = self._mapping[event.pitch]
-        elif event.pitch in self._bend_mapping:
-            # No pure note, but bend is available
-            tab_hole, bend_notation = self._bend_mapping[event.pitch]
-            is_bend = True
-        else:
+        # Pure notes take priority over bends (resolved once in __init__)
+        resolved = self._resolve.get(event.pitch)
+        if resolved is None:
             # Pitch not mappable
             return None
+        tab_hole, is_bend, bend_notation = resolved
 
         # Validate timing
         if event.end_time <= event.start_time:
@@ -175,12 +181,25 @@ class TabMapper:
         Returns:
             Dict with mapping statistics
         """
+        # Mapping is never empty (checked in __init__); one pass for all stats
+        pitch_min = pitch_max = next(iter(self._mapping))
+        blow_holes = draw_holes = 0
+        for pitch, hole in self._mapping.items():
+            if pitch < pitch_min:
+                pitch_min = pitch
+            elif pitch > pitch_max:
+                pitch_max = pitch
+            if hole > 0:
+                blow_holes += 1
+            elif hole < 0:
+                draw_holes += 1
+
         return {
             "total_mapped_pitches": len(self._mapping),
-            "pitch_range_min": min(self._mapping.keys()) if self._mapping else 0,
-            "pitch_range_max": max(self._mapping.keys()) if self._mapping else 0,
-            "blow_holes": len([v for v in self._mapping.values() if v > 0]),
-            "draw_holes": len([v for v in self._mapping.values() if v < 0]),
+            "pitch_range_min": pitch_min,
+            "pitch_range_max": pitch_max,
+            "blow_holes": blow_holes,
+            "draw_holes": draw_holes,
         }
 
 
@@ -8,6 +8,7 @@ NOTE: This component is complex and may need significant improvement.
 See TODO: Analyze and improve tab matching algorithm for better accuracy.
 """
 
+from operator import attrgetter
 from typing import Dict, List, Optional
 from tab_converter.models import TabEntry, Tabs
 from tab_phrase_animator.tab_text_parser import ParsedNote
@@ -77,7 +78,7 @@ class TabMatcher:
         self._reset_statistics()
 
         # Create working copy of MIDI entries, sorted by time
-        midi_entries: List[TabEntry] = sorted(midi_tabs.tabs, key=lambda e: e.time)
+        midi_entries: List[TabEntry] = sorted(midi_tabs.tabs, key=attrgetter("time"))
         result: Dict[str, List[List[Optional[List[TabEntry]]]]] = {}
 
         if self.enable_debug:
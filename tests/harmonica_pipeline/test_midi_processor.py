@@ -169,7 +169,10 @@ class TestMidiProcessorLoadNoteEvents:
         processor = MidiProcessor(str(midi_file))
 
         # Mock the MIDI loading to include invalid notes
-        with patch("pretty_midi.PrettyMIDI") as mock_midi:
+        with (
+            patch("harmonica_pipeline.midi_processor.SYMUSIC_AVAILABLE", False),
+            patch("pretty_midi.PrettyMIDI") as mock_midi,
+        ):
             mock_instrument = MagicMock()
 
             # Valid note
@@ -261,7 +264,10 @@ class TestMidiProcessorLoadNoteEvents:
         processor = MidiProcessor(str(midi_file))
 
         # Mock MIDI loading to return instrument with no notes
-        with patch("pretty_midi.PrettyMIDI") as mock_midi:
+        with (
+            patch("harmonica_pipeline.midi_processor.SYMUSIC_AVAILABLE", False),
+            patch("pretty_midi.PrettyMIDI") as mock_midi,
+        ):
             mock_instrument = MagicMock()
             mock_instrument.notes = []
             mock_instrument.pitch_bends = []
@@ -270,6 +276,108 @@ class TestMidiProcessorLoadNoteEvents:
             with pytest.raises(MidiProcessorError, match="No valid note events found"):
                 processor.load_note_events()
 
+    def test_iter_note_events_matches_load(self, temp_test_dir):
+        """Test that streaming yields the same events as load_note_events."""
+        midi_file = temp_test_dir / "test.mid"
+        midi_data = pretty_midi.PrettyMIDI()
+        instrument = pretty_midi.Instrument(program=0)
+        for pitch, start in [(60, 0.0), (64, 0.5), (67, 1.0)]:
+            instrument.notes.append(
+                pretty_midi.Note(
+                    velocity=100, pitch=pitch, start=start, end=start + 0.5
+                )
+            )
+        midi_data.instruments.append(instrument)
+        midi_data.write(str(midi_file))
+
+        processor = MidiProcessor(str(midi_file))
+        events = processor.iter_note_events()
+
+        assert not isinstance(events, list)
+        assert list(events) == processor.load_note_events()
+
+    def test_symusic_backend_matches_pretty_midi(self, temp_test_dir):
+        """Test that the symusic fast path loads the same notes as pretty_midi."""
+        pytest.importorskip("symusic")
+
+        midi_file = temp_test_dir / "test.mid"
+        midi_data = pretty_midi.PrettyMIDI()
+        instrument = pretty_midi.Instrument(program=0)
+        for pitch, start, end in [(60, 0.0, 0.5), (64, 0.5, 1.25), (67, 1.5, 2.0)]:
+            instrument.notes.append(
+                pretty_midi.Note(velocity=100, pitch=pitch, start=start, end=end)
+            )
+        midi_data.instruments.append(instrument)
+        midi_data.write(str(midi_file))
+
+        fast_events = MidiProcessor(str(midi_file), use_symusic=True).load_note_events()
+        slow_events = MidiProcessor(str(midi_file)).load_note_events()
+
+        assert len(fast_events) == len(slow_events)
+        for fast, slow in zip(fast_events, slow_events):
+            assert fast[2:] == slow[2:]
+            assert fast[0] == pytest.approx(slow[0], abs=1e-4)
+            assert fast[1] == pytest.approx(slow[1], abs=1e-4)
+
+    def test_symusic_backend_matches_pretty_midi_overlapping_notes(self, temp_test_dir):
+        """Test that overlapping same-pitch notes end where pretty_midi ends them."""
+        pytest.importorskip("symusic")
+        mido = pytest.importorskip("mido")
+
+        # Two C4 note-ons (0.5s, 0.75s) followed by two note-offs (0.875s, 1.0s)
+        midi_file = temp_test_dir / "overlap.mid"
+        midi = mido.MidiFile(ticks_per_beat=480)
+        track = mido.MidiTrack()
+        midi.tracks.append(track)
+        track.append(mido.MetaMessage("set_tempo", tempo=500000, time=0))
+        last_tick = 0
+        for tick, kind in [
+            (480, "note_on"),
+            (720, "note_on"),
+            (840, "note_off"),
+            (960, "note_off"),
+        ]:
+            track.append(
+                mido.Message(kind, note=60, velocity=100, time=tick - last_tick)
+            )
+            last_tick = tick
+        midi.save(str(midi_file))
+
+        fast_events = sorted(
+            MidiProcessor(str(midi_file), use_symusic=True).load_note_events()
+        )
+        slow_events = sorted(MidiProcessor(str(midi_file)).load_note_events())
+
+        assert [e[:2] for e in slow_events] == [(0.5, 0.875), (0.75, 0.875)]
+        assert len(fast_events) == len(slow_events)
+        for fast, slow in zip(fast_events, slow_events):
+            assert fast[2:] == slow[2:]
+            assert fast[0] == pytest.approx(slow[0], abs=1e-4)
+            assert fast[1] == pytest.approx(slow[1], abs=1e-4)
+
+    def test_pretty_midi_is_default_backend(self, temp_test_dir):
+        """Test that symusic is only used when explicitly requested."""
+        midi_file = temp_test_dir / "test.mid"
+        midi_file.write_bytes(b"")
+
+        processor = MidiProcessor(str(midi_file))
+
+        assert processor.use_symusic is False
+        with patch.object(
+            processor, "_load_tracks_pretty_midi", return_value=[]
+        ) as load_pretty:
+            assert list(processor.iter_note_events()) == []
+        load_pretty.assert_called_once()
+
+    def test_use_symusic_without_symusic_raises_error(self, temp_test_dir):
+        """Test that requesting symusic when it is not installed fails early."""
+        midi_file = temp_test_dir / "test.mid"
+        midi_file.write_bytes(b"")
+
+        with patch("harmonica_pipeline.midi_processor.SYMUSIC_AVAILABLE", False):
+            with pytest.raises(MidiProcessorError, match="symusic is not installed"):
+                MidiProcessor(str(midi_file), use_symusic=True)
+
 
 class TestMidiProcessorIntegration:
     """Integration tests for MidiProcessor."""
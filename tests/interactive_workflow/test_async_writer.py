@@ -0,0 +1,49 @@
+"""Tests for async_writer module."""
+
+import pytest
+
+from interactive_workflow.async_writer import AsyncSessionWriter
+
+
+class TestAsyncSessionWriter:
+    """Tests for AsyncSessionWriter."""
+
+    def test_operations_applied_in_order(self, tmp_path):
+        """Test queued operations land in submission order."""
+        target = tmp_path / "session.json"
+        journal = tmp_path / "session.json.jrnl"
+
+        writer = AsyncSessionWriter()
+        writer.append(str(journal), b"line 1\n")
+        writer.append(str(journal), b"line 2\n")
+        writer.write(str(target), b"first")
+        writer.write(str(target), b"second")
+        writer.flush()
+
+        assert target.read_bytes() == b"second"
+        assert journal.read_bytes() == b"line 1\nline 2\n"
+        assert not (tmp_path / "session.json.tmp").exists()
+
+        writer.unlink(str(journal))
+        writer.unlink(str(journal))  # Missing file is ignored
+        writer.flush()
+        assert not journal.exists()
+
+    def test_flush_without_writes(self):
+        """Test flushing an unused writer returns immediately."""
+        writer = AsyncSessionWriter()
+        writer.flush()
+
+    def test_flush_raises_write_error(self, tmp_path):
+        """Test errors on the writer thread surface on flush."""
+        writer = AsyncSessionWriter()
+        writer.write(str(tmp_path / "missing" / "session.json"), b"{}")
+
+        with pytest.raises(OSError):
+            writer.flush()
+
+        # The error is reported once; the writer keeps working
+        target = tmp_path / "session.json"
+        writer.write(str(target), b"{}")
+        writer.flush()
+        assert target.read_bytes() == b"{}"
@@ -1,13 +1,14 @@
 """Tests for workflow orchestrator."""
 
 import json
+import os
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from interactive_workflow.orchestrator import WorkflowOrchestrator
-from interactive_workflow.state_machine import WorkflowState
+from interactive_workflow.state_machine import WorkflowSession, WorkflowState
 
 
 class TestOrchestratorInitialization:
@@ -29,6 +30,21 @@ class TestOrchestratorInitialization:
         assert orchestrator.session.song_name == "MySong"
         assert orchestrator.session.state == WorkflowState.INIT
 
+    def test_new_session_does_not_import_questionary(self, tmp_path):
+        """Test questionary is only imported when there is a session to resume."""
+        import sys
+
+        # A None entry makes "import questionary" raise ImportError
+        with patch.dict(sys.modules, {"questionary": None}):
+            orchestrator = WorkflowOrchestrator(
+                input_video="MySong_KeyG.mp4",
+                input_tabs="MySong.txt",
+                session_dir=str(tmp_path / "sessions"),
+                auto_approve=False,
+            )
+
+        assert orchestrator.session.state == WorkflowState.INIT
+
     def test_session_file_path_generation(self, tmp_path):
         """Test session file path is generated correctly."""
         session_dir = tmp_path / "sessions"
@@ -57,6 +73,29 @@ class TestOrchestratorInitialization:
 
         assert session_dir.exists()
 
+    def test_log_handler_installed_once_per_log_file(self, tmp_path):
+        """Test repeated orchestrators share one log handler per session dir."""
+        import logging
+
+        session_dir = str(tmp_path / "sessions")
+        for _ in range(2):
+            orchestrator = WorkflowOrchestrator(
+                input_video="Song_KeyC.mp4",
+                input_tabs="song.txt",
+                session_dir=session_dir,
+                auto_approve=True,
+            )
+
+        log_handlers = [
+            handler
+            for handler in logging.getLogger().handlers
+            if getattr(handler, "baseFilename", None)
+            == str(Path(orchestrator.log_file).resolve())
+        ]
+        assert len(log_handlers) == 1
+        assert logging.getLogger("tensorflow").propagate is False
+        assert log_handlers[0] in logging.getLogger("tensorflow").handlers
+
     def test_filename_config_parsed(self, tmp_path):
         """Test filename configuration is parsed correctly."""
         orchestrator = WorkflowOrchestrator(
@@ -132,6 +171,21 @@ class TestSessionResumption:
         # Should have created new session in INIT state
         assert orchestrator2.session.state == WorkflowState.INIT
 
+    def test_new_session_skips_load_when_file_absent(self, tmp_path):
+        """Test that no session load is attempted without a session file."""
+        with patch(
+            "interactive_workflow.orchestrator.WorkflowSession.load"
+        ) as mock_load:
+            orchestrator = WorkflowOrchestrator(
+                input_video="MySong_KeyG.mp4",
+                input_tabs="MySong.txt",
+                session_dir=str(tmp_path / "sessions"),
+                auto_approve=True,
+            )
+
+        mock_load.assert_not_called()
+        assert orchestrator.session.state == WorkflowState.INIT
+
 
 class TestWorkflowSteps:
     """Tests for individual workflow steps."""
@@ -173,6 +227,60 @@ class TestWorkflowSteps:
         orchestrator._step_stem_selection()
         assert orchestrator.session.state == WorkflowState.MIDI_GENERATION
 
+    def test_demucs_starts_midi_generator_warmup(self, tmp_path):
+        """Test the MIDI generator import overlaps with Demucs separation."""
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC_Stem.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=False,
+        )
+        orchestrator.session.transition_to(WorkflowState.STEM_SELECTION)
+
+        with (
+            patch("questionary.confirm") as mock_confirm,
+            patch.object(
+                orchestrator, "_run_demucs_separation", return_value=True
+            ) as mock_demucs,
+        ):
+            mock_confirm.return_value.ask.return_value = True
+            orchestrator._step_stem_selection()
+
+        mock_demucs.assert_called_once()
+        assert orchestrator._midi_warmup is not None
+        orchestrator._midi_warmup.result(timeout=30)
+
+        orchestrator.session.transition_to(WorkflowState.MIDI_GENERATION)
+        with (
+            patch("harmonica_pipeline.midi_generator.MidiGenerator") as mock_gen,
+            patch("os.path.exists", return_value=False),
+            patch("subprocess.Popen"),  # Prevent Finder from opening
+        ):
+            orchestrator._step_midi_generation()
+
+        mock_gen.assert_called_once()
+        assert orchestrator._midi_warmup is None
+
+    def test_run_preloads_pipeline_modules(self, tmp_path):
+        """Test run() imports the video/tab pipeline in the background."""
+        import sys
+
+        from interactive_workflow.orchestrator import PIPELINE_MODULES
+
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+        orchestrator.session.state = WorkflowState.COMPLETE
+
+        orchestrator.run()
+
+        assert orchestrator._pipeline_warmup is not None
+        orchestrator._pipeline_warmup.result(timeout=60)
+        assert all(name in sys.modules for name in PIPELINE_MODULES)
+
     def test_midi_generation_step(self, tmp_path):
         """Test MIDI generation step transitions to MIDI fixing."""
         orchestrator = WorkflowOrchestrator(
@@ -191,6 +299,87 @@ class TestWorkflowSteps:
                 mock_gen.assert_called_once()
                 assert orchestrator.session.state == WorkflowState.MIDI_FIXING
 
+    def test_midi_generation_failure_propagates(self, tmp_path):
+        """Test errors from the generator thread reach the step."""
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+        orchestrator.session.transition_to(WorkflowState.MIDI_GENERATION)
+
+        with patch("harmonica_pipeline.midi_generator.MidiGenerator") as mock_gen:
+            mock_gen.return_value.generate.side_effect = RuntimeError("no audio")
+            with patch("os.path.exists", return_value=False):
+                with pytest.raises(RuntimeError, match="no audio"):
+                    orchestrator._step_midi_generation()
+
+        assert orchestrator.session.state == WorkflowState.MIDI_GENERATION
+
+    def test_wait_with_status_outlasts_poll_interval(self, tmp_path):
+        """Test calls longer than one poll interval finish or raise normally."""
+        import time
+
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+        calls = []
+
+        def slow_call():
+            time.sleep(0.6)
+            calls.append("done")
+
+        def slow_failure():
+            time.sleep(0.6)
+            raise RuntimeError("late failure")
+
+        orchestrator._wait_with_status("Working...", slow_call)
+        assert calls == ["done"]
+
+        with pytest.raises(RuntimeError, match="late failure"):
+            orchestrator._wait_with_status("Working...", slow_failure)
+
+    def test_wait_with_status_interrupt_does_not_join_worker(self, tmp_path):
+        """Test Ctrl-C returns while the call is still running on a daemon thread."""
+        import threading
+
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_call():
+            started.set()
+            release.wait(10)
+
+        def interrupt(*args, **kwargs):
+            started.wait(5)
+            raise KeyboardInterrupt
+
+        try:
+            with patch("interactive_workflow.orchestrator.wait", side_effect=interrupt):
+                with pytest.raises(KeyboardInterrupt):
+                    orchestrator._wait_with_status("Working...", blocking_call)
+
+            workers = [
+                thread
+                for thread in threading.enumerate()
+                if thread.name == "workflow-step"
+            ]
+            # Still running, and a daemon so interpreter exit won't join it
+            assert workers and all(thread.daemon for thread in workers)
+            assert not release.is_set()
+        finally:
+            release.set()
+
     def test_midi_generation_uses_existing_midi(self, tmp_path):
         """Test MIDI generation skips when existing MIDI found and user declines overwrite."""
         orchestrator = WorkflowOrchestrator(
@@ -205,7 +394,7 @@ class TestWorkflowSteps:
         # Mock questionary to decline overwrite, and subprocess to prevent Finder
         with (
             patch("os.path.exists", return_value=True),
-            patch("subprocess.run"),  # Prevent Finder from opening
+            patch("subprocess.Popen"),  # Prevent Finder from opening
             patch("questionary.confirm") as mock_confirm,
             patch("harmonica_pipeline.midi_generator.MidiGenerator") as mock_gen,
         ):
@@ -216,6 +405,62 @@ class TestWorkflowSteps:
             # Should transition to MIDI_FIXING
             assert orchestrator.session.state == WorkflowState.MIDI_FIXING
 
+    def test_midi_generation_remembers_keep_decision(self, tmp_path):
+        """Test a keep answer is reused until the MIDI file changes."""
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=False,
+        )
+        midi_file = tmp_path / "MySong_fixed.mid"
+        midi_file.write_bytes(b"MThd")
+        orchestrator._paths.fixed_midi = str(midi_file)
+
+        with (
+            patch.object(orchestrator, "_midi_file_exists", return_value=True),
+            patch("questionary.confirm") as mock_confirm,
+            patch("harmonica_pipeline.midi_generator.MidiGenerator") as mock_gen,
+        ):
+            mock_confirm.return_value.ask.return_value = False
+            orchestrator.session.state = WorkflowState.MIDI_GENERATION
+            orchestrator._step_midi_generation()
+            orchestrator.session.state = WorkflowState.MIDI_GENERATION
+            orchestrator._step_midi_generation()
+            assert mock_confirm.call_count == 1
+
+            # A rewritten file invalidates the stored decision
+            stat = midi_file.stat()
+            os.utime(midi_file, (stat.st_atime, stat.st_mtime + 10))
+            orchestrator.session.state = WorkflowState.MIDI_GENERATION
+            orchestrator._step_midi_generation()
+            assert mock_confirm.call_count == 2
+            mock_gen.assert_not_called()
+
+    def test_midi_generation_keep_does_not_wait_for_import(self, tmp_path):
+        """Test keeping an existing MIDI never blocks on the generator import."""
+        from concurrent.futures import Future
+
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=False,
+        )
+        orchestrator.session.transition_to(WorkflowState.MIDI_GENERATION)
+        pending_import: Future = Future()  # Never resolves
+        orchestrator._midi_warmup = pending_import
+
+        with (
+            patch.object(orchestrator, "_midi_file_exists", return_value=True),
+            patch("questionary.confirm") as mock_confirm,
+        ):
+            mock_confirm.return_value.ask.return_value = False
+            orchestrator._step_midi_generation()
+
+        assert orchestrator.session.state == WorkflowState.MIDI_FIXING
+        assert orchestrator._midi_warmup is pending_import
+
     def test_midi_generation_overwrites_existing_midi(self, tmp_path):
         """Test MIDI generation overwrites when existing MIDI found and user confirms."""
         orchestrator = WorkflowOrchestrator(
@@ -230,7 +475,7 @@ class TestWorkflowSteps:
         # Mock questionary to accept overwrite, and subprocess to prevent Finder
         with (
             patch("os.path.exists", return_value=True),
-            patch("subprocess.run"),  # Prevent Finder from opening
+            patch("subprocess.Popen"),  # Prevent Finder from opening
             patch("questionary.confirm") as mock_confirm,
             patch("harmonica_pipeline.midi_generator.MidiGenerator") as mock_gen,
         ):
@@ -517,6 +762,72 @@ class TestWorkflowSteps:
         mock_generate.assert_called_once()
         assert orchestrator.session.state == WorkflowState.HARMONICA_REVIEW
 
+    def test_tab_generation_failure_skips_tab_video(self, tmp_path):
+        """Test that failed tab generation skips validation and the tab video."""
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs=str(tmp_path / "nonexistent.txt"),
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+        orchestrator.session.transition_to(WorkflowState.TAB_GENERATION)
+
+        with (
+            patch.object(
+                WorkflowOrchestrator, "_generate_tabs_from_midi", return_value=False
+            ) as mock_generate,
+            patch("utils.midi_validator.validate_midi") as mock_validate,
+        ):
+            orchestrator._step_tab_generation()
+
+        mock_generate.assert_called_once()
+        mock_validate.assert_not_called()
+        assert orchestrator.session.get_data("skip_tab_video") is True
+        assert orchestrator.session.state == WorkflowState.HARMONICA_REVIEW
+
+    def test_octave_warning_counts_registers(self, tmp_path):
+        """Test octave warning buckets blow and draw holes by register."""
+        from tab_converter.models import TabEntry, Tabs
+
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+        holes = [7, -8, 9, -10, 7, 8, -7, 5, -4, -3]
+        tabs = Tabs(
+            [TabEntry(tab=h, time=0.0, duration=0.1, confidence=1.0) for h in holes]
+        )
+
+        with patch.object(orchestrator.console, "print") as mock_print:
+            orchestrator._check_octave_warning(tabs)
+
+        panel = mock_print.call_args.args[0]
+        assert "Upper register (7-10): 7 notes" in panel.renderable
+        assert "Middle register (4-6): 2 notes" in panel.renderable
+        assert "Lower register (1-3): 1 notes" in panel.renderable
+
+    def test_octave_warning_silent_at_sixty_percent(self, tmp_path):
+        """Test octave warning requires strictly more than 60% upper notes."""
+        from tab_converter.models import TabEntry, Tabs
+
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+        holes = [7, -8, 9, 4, -2]
+        tabs = Tabs(
+            [TabEntry(tab=h, time=0.0, duration=0.1, confidence=1.0) for h in holes]
+        )
+
+        with patch.object(orchestrator.console, "print") as mock_print:
+            orchestrator._check_octave_warning(tabs)
+
+        mock_print.assert_not_called()
+
     def test_tab_generation_skips_when_file_exists(self, tmp_path):
         """Test tab generation step skips generation when tab file exists."""
         # Create existing tab file
@@ -580,7 +891,7 @@ class TestWorkflowSteps:
         # Mock VideoCreator, subprocess (folder opening), and questionary
         with (
             patch("harmonica_pipeline.video_creator.VideoCreator"),
-            patch("subprocess.run"),  # Prevent Finder from opening
+            patch("subprocess.Popen"),  # Prevent Finder from opening
             patch("questionary.confirm") as mock_confirm,
         ):
             mock_confirm.return_value.ask.return_value = False
@@ -588,6 +899,110 @@ class TestWorkflowSteps:
             # Should return to MIDI_FIXING for re-editing
             assert orchestrator.session.state == WorkflowState.MIDI_FIXING
 
+    def test_harmonica_review_reuses_creator_on_retry(self, tmp_path):
+        """Test a retry with unchanged inputs reuses the VideoCreator."""
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=False,
+        )
+
+        with (
+            patch("harmonica_pipeline.video_creator.VideoCreator") as mock_creator,
+            patch.object(orchestrator, "_open_file"),
+            patch("questionary.confirm") as mock_confirm,
+        ):
+            mock_confirm.return_value.ask.return_value = False
+            for fps in (15, 15, 30):
+                orchestrator.session.set_data("fps", fps)
+                orchestrator.session.transition_to(WorkflowState.HARMONICA_REVIEW)
+                orchestrator._step_harmonica_review()
+
+            # Same FPS reuses the creator; a new FPS builds a new one
+            assert mock_creator.call_count == 2
+            assert mock_creator.return_value.create.call_count == 3
+
+    def test_auto_approve_renders_tab_video_in_parallel(self, tmp_path):
+        """Test auto-approve renders the tab video alongside the harmonica video."""
+        from concurrent.futures import Future
+
+        tabs_path = tmp_path / "MySong.txt"
+        tabs_path.write_text("page 1:\n1 2 3")
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs=str(tabs_path),
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+        orchestrator.project_temp_dir = str(tmp_path / "temp") + "/"
+        orchestrator.session.transition_to(WorkflowState.HARMONICA_REVIEW)
+
+        render = Future()
+        render.set_result(None)
+        with (
+            patch(
+                "interactive_workflow.orchestrator.ProcessPoolExecutor"
+            ) as mock_executor,
+            patch("harmonica_pipeline.video_creator.VideoCreator") as mock_creator,
+        ):
+            mock_executor.return_value.submit.return_value = render
+            orchestrator._step_harmonica_review()
+
+            submit_args = mock_executor.return_value.submit.call_args.args
+            assert submit_args[2:] == (False, True)
+            assert submit_args[1].temp_dir.startswith(str(tmp_path / "temp"))
+            assert submit_args[1].temp_dir != orchestrator.project_temp_dir
+
+            orchestrator._step_tab_video_review()
+
+        mock_executor.return_value.shutdown.assert_called_once_with(
+            wait=True, cancel_futures=True
+        )
+        # Only the harmonica video was rendered in-process
+        mock_creator.return_value.create.assert_called_once_with(
+            create_harmonica=True, create_tabs=False
+        )
+        assert orchestrator.session.state == WorkflowState.FINALIZATION
+        assert (
+            orchestrator.session.get_data("tab_video") == orchestrator._paths.tab_video
+        )
+
+    def test_failed_harmonica_render_shuts_down_tab_render(self, tmp_path):
+        """Test a failing harmonica render cancels and shuts down the tab worker."""
+        from concurrent.futures import Future
+
+        tabs_path = tmp_path / "MySong.txt"
+        tabs_path.write_text("page 1:\n1 2 3")
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs=str(tabs_path),
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+        orchestrator.project_temp_dir = str(tmp_path / "temp") + "/"
+        orchestrator.session.transition_to(WorkflowState.HARMONICA_REVIEW)
+
+        render = Future()
+        with (
+            patch(
+                "interactive_workflow.orchestrator.ProcessPoolExecutor"
+            ) as mock_executor,
+            patch("harmonica_pipeline.video_creator.VideoCreator") as mock_creator,
+        ):
+            mock_executor.return_value.submit.return_value = render
+            mock_creator.return_value.create.side_effect = RuntimeError("boom")
+
+            with pytest.raises(RuntimeError, match="boom"):
+                orchestrator._step_harmonica_review()
+
+        assert render.cancelled()
+        mock_executor.return_value.shutdown.assert_called_once_with(
+            wait=True, cancel_futures=True
+        )
+        assert orchestrator._tab_video_render is None
+        assert orchestrator._tab_video_executor is None
+
     def test_tab_video_review_step_approved(self, tmp_path):
         """Test tab video review step transitions when approved."""
         orchestrator = WorkflowOrchestrator(
@@ -622,6 +1037,62 @@ class TestWorkflowSteps:
             orchestrator._step_finalization()
         assert orchestrator.session.state == WorkflowState.COMPLETE
 
+    def test_finalization_skips_zip_for_missing_or_empty_videos(
+        self, tmp_path, monkeypatch
+    ):
+        """Test finalization does not create a ZIP when no video has content."""
+        monkeypatch.chdir(tmp_path)
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+        (tmp_path / "outputs").mkdir()
+        empty_video = tmp_path / "outputs" / "MySong_harmonica.mp4"
+        empty_video.touch()
+        orchestrator.session.set_data("harmonica_video", str(empty_video))
+        orchestrator.session.set_data("tab_video", str(tmp_path / "missing.mp4"))
+        orchestrator.session.transition_to(WorkflowState.FINALIZATION)
+
+        with patch("zipfile.ZipFile") as mock_zip:
+            orchestrator._step_finalization()
+
+        mock_zip.assert_not_called()
+        assert orchestrator.session.state == WorkflowState.COMPLETE
+
+    def test_finalization_zips_existing_videos(self, tmp_path, monkeypatch):
+        """Test finalization packages only the videos that exist."""
+        import zipfile
+
+        monkeypatch.chdir(tmp_path)
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+        (tmp_path / "outputs").mkdir()
+        video = tmp_path / "outputs" / "MySong_harmonica.mp4"
+        video.write_bytes(b"video")
+        orchestrator.session.set_data("harmonica_video", str(video))
+        orchestrator.session.set_data("tab_video", str(tmp_path / "missing.mp4"))
+        orchestrator.session.transition_to(WorkflowState.FINALIZATION)
+
+        with patch.object(orchestrator.console, "print") as mock_print:
+            orchestrator._step_finalization()
+
+        # Intro panel plus one summary panel with every result
+        assert mock_print.call_count == 2
+        summary = mock_print.call_args.args[0].renderable
+        assert "Created ZIP: outputs/MySong_C.zip" in summary
+
+        with zipfile.ZipFile(tmp_path / "outputs" / "MySong_C.zip") as zf:
+            assert zf.namelist() == ["MySong_harmonica.mp4"]
+            assert zf.getinfo("MySong_harmonica.mp4").compress_type == (
+                zipfile.ZIP_STORED
+            )
+
 
 class TestWorkflowExecution:
     """Tests for complete workflow execution."""
@@ -640,6 +1111,24 @@ class TestWorkflowExecution:
         orchestrator._execute_current_step()
         assert orchestrator.session.state == WorkflowState.MIDI_GENERATION
 
+    def test_execute_current_step_uses_patched_handler(self, tmp_path):
+        """Test dispatch resolves handlers per call and rejects end states."""
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC_NoStem.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+
+        orchestrator.session.state = WorkflowState.HARMONICA_REVIEW
+        with patch.object(orchestrator, "_step_harmonica_review") as mock_step:
+            orchestrator._execute_current_step()
+        mock_step.assert_called_once_with()
+
+        orchestrator.session.state = WorkflowState.COMPLETE
+        with pytest.raises(ValueError, match="Unknown workflow state"):
+            orchestrator._execute_current_step()
+
     def test_run_complete_workflow_auto_approve(self, tmp_path):
         """Test running complete workflow with auto-approve."""
         orchestrator = WorkflowOrchestrator(
@@ -664,6 +1153,44 @@ class TestWorkflowExecution:
             assert orchestrator.session.is_complete()
             assert orchestrator.session.get_progress_percentage() == 100
 
+    def test_run_keeps_step_error_when_session_flush_fails(self, tmp_path):
+        """Test a failing session write does not mask the step's exception."""
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+
+        with (
+            patch.object(
+                orchestrator,
+                "_execute_current_step",
+                side_effect=RuntimeError("step failed"),
+            ),
+            patch.object(
+                orchestrator._writer, "flush", side_effect=OSError("disk full")
+            ),
+        ):
+            with pytest.raises(RuntimeError, match="step failed"):
+                orchestrator.run()
+
+    def test_run_raises_session_flush_error_on_success(self, tmp_path):
+        """Test a failing session write is reported when the run succeeded."""
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+        orchestrator.session.transition_to(WorkflowState.COMPLETE)
+
+        with patch.object(
+            orchestrator._writer, "flush", side_effect=OSError("disk full")
+        ):
+            with pytest.raises(OSError, match="disk full"):
+                orchestrator.run()
+
     def test_run_workflow_with_stem(self, tmp_path):
         """Test workflow with stem separation enabled."""
         orchestrator = WorkflowOrchestrator(
@@ -707,6 +1234,155 @@ class TestWorkflowExecution:
         assert session_data["state"] == "midi_generation"
 
 
+class TestOpenFolder:
+    """Tests for opening folders in the system file browser."""
+
+    def test_open_folder_does_not_block(self, tmp_path):
+        """Test the file browser is spawned without waiting for it."""
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=False,
+        )
+        folder = tmp_path / "outputs"
+
+        with (
+            patch("platform.system", return_value="Linux"),
+            patch("subprocess.Popen") as mock_popen,
+        ):
+            orchestrator._open_folder(str(folder))
+
+        assert folder.is_dir()
+        args, kwargs = mock_popen.call_args
+        assert args[0] == ["xdg-open", str(folder)]
+        assert kwargs["start_new_session"] is True
+        mock_popen.return_value.wait.assert_not_called()
+        assert orchestrator._spawned_openers == [mock_popen.return_value]
+
+    def test_open_folder_only_once_per_folder(self, tmp_path):
+        """Test a folder already shown this run is not opened again."""
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=False,
+        )
+
+        with patch("subprocess.Popen") as mock_popen:
+            orchestrator._open_folder(str(tmp_path / "outputs"))
+            orchestrator._open_folder(str(tmp_path / "outputs"))
+            orchestrator._open_folder(str(tmp_path / "tabs"))
+
+        assert mock_popen.call_count == 2
+
+    def test_open_file_launches_video(self, tmp_path):
+        """Test a rendered video is opened directly in the default player."""
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=False,
+        )
+        video = tmp_path / "MySong_harmonica.mp4"
+        video.write_bytes(b"video")
+
+        with (
+            patch("platform.system", return_value="Linux"),
+            patch("subprocess.Popen") as mock_popen,
+        ):
+            orchestrator._open_file(str(video))
+
+        mock_popen.assert_called_once()
+        assert mock_popen.call_args.args[0] == ["xdg-open", str(video)]
+
+    def test_open_file_falls_back_to_folder(self, tmp_path):
+        """Test a missing video opens its folder instead."""
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=False,
+        )
+
+        with (
+            patch("platform.system", return_value="Linux"),
+            patch("subprocess.Popen") as mock_popen,
+        ):
+            orchestrator._open_file(str(tmp_path / "missing.mp4"))
+
+        assert mock_popen.call_args.args[0] == ["xdg-open", str(tmp_path)]
+
+    def test_open_folder_skipped_in_auto_approve(self, tmp_path):
+        """Test no file browser is spawned in auto-approve mode."""
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+
+        with patch("subprocess.Popen") as mock_popen:
+            orchestrator._open_folder(str(tmp_path / "outputs"))
+
+        mock_popen.assert_not_called()
+
+
+class TestSkipTo:
+    """Tests for jumping directly to a later workflow stage."""
+
+    @pytest.fixture
+    def output_dirs(self, tmp_path):
+        """Temporary MIDI and outputs directories patched into utils."""
+        midi_dir = tmp_path / "fixed_midis"
+        outputs_dir = tmp_path / "outputs"
+        midi_dir.mkdir()
+        outputs_dir.mkdir()
+        with (
+            patch("interactive_workflow.orchestrator.MIDI_DIR", str(midi_dir)),
+            patch("interactive_workflow.orchestrator.OUTPUTS_DIR", str(outputs_dir)),
+        ):
+            yield midi_dir, outputs_dir
+
+    def test_skip_to_finalize_finds_existing_files(self, tmp_path, output_dirs):
+        """Test skip-to picks up MIDI and videos from a single directory scan."""
+        midi_dir, outputs_dir = output_dirs
+        (midi_dir / "MySong_fixed.mid").touch()
+        (outputs_dir / "MySong_harmonica.mp4").touch()
+        (outputs_dir / "MySong_full_tabs.mov").touch()
+
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+            skip_to="finalize",
+        )
+
+        session = orchestrator.session
+        assert session.state == WorkflowState.FINALIZATION
+        assert session.get_data("generated_midi").endswith("MySong_fixed.mid")
+        assert session.get_data("harmonica_video").endswith("MySong_harmonica.mp4")
+        # Legacy .mov tab video is used when the .mp4 is missing
+        assert session.get_data("tab_video").endswith("MySong_full_tabs.mov")
+        assert "MySong_fixed.mid" in orchestrator._midi_index
+
+    def test_skip_to_without_files(self, tmp_path, output_dirs):
+        """Test skip-to leaves session data empty when nothing exists."""
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+            skip_to="finalize",
+        )
+
+        assert orchestrator.session.get_data("generated_midi") is None
+        assert orchestrator.session.get_data("harmonica_video") is None
+        assert orchestrator.session.get_data("tab_video") is None
+        assert not orchestrator._midi_file_exists("MySong_fixed.mid")
+
+
 class TestErrorHandling:
     """Tests for error handling and recovery."""
 
@@ -776,6 +1452,95 @@ class TestSessionPersistence:
         assert session_data["config"]["enable_stem"] is True
         assert session_data["data"]["test_key"] == "test_value"
 
+    def test_save_session_skips_when_clean(self, tmp_path):
+        """Test repeated saves without new steps only write once."""
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+
+        with (
+            patch.object(WorkflowSession, "save") as mock_save,
+            patch.object(orchestrator._writer, "write") as mock_write,
+        ):
+            orchestrator._save_session()
+            orchestrator._save_session()
+            assert mock_save.call_count == 1
+
+            # Later saves go through the background writer
+            orchestrator._mark_dirty()
+            orchestrator._save_session()
+            orchestrator._save_session()
+            assert mock_save.call_count == 1
+            assert mock_write.call_count == 1
+
+    def test_save_session_skips_unchanged_review_loop(self, tmp_path):
+        """Test a step that neither transitions nor sets data is not saved."""
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+        orchestrator._save_session()
+
+        with (
+            patch.object(orchestrator._writer, "write") as mock_write,
+            patch.object(orchestrator._writer, "append") as mock_append,
+        ):
+            orchestrator._save_session()
+            mock_write.assert_not_called()
+            mock_append.assert_not_called()
+
+            orchestrator.session.transition_to(WorkflowState.MIDI_FIXING)
+            orchestrator._save_session()
+            mock_append.assert_called_once()
+
+    def test_later_saves_written_in_background(self, tmp_path):
+        """Test background saves reach disk once the writer is flushed."""
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+        orchestrator._save_session()
+
+        orchestrator.session.transition_to(WorkflowState.MIDI_FIXING)
+        orchestrator._mark_dirty()
+        orchestrator._save_session()
+        orchestrator.session.set_data("fps", 30)
+        orchestrator._mark_dirty()
+        orchestrator._save_session()
+        orchestrator._writer.flush()
+
+        with open(orchestrator.session_file) as f:
+            session_data = json.load(f)
+        assert session_data["state"] == "midi_fixing"
+        assert session_data["data"]["fps"] == 30
+        assert not Path(orchestrator.session_file + ".jrnl").exists()
+
+    def test_system_exit_saves_session(self, tmp_path):
+        """Test exiting at an approval gate flushes pending state."""
+        orchestrator = WorkflowOrchestrator(
+            input_video="MySong_KeyC_NoStem.mp4",
+            input_tabs="MySong.txt",
+            session_dir=str(tmp_path / "sessions"),
+            auto_approve=True,
+        )
+
+        # INIT -> MIDI_GENERATION is batched; exiting must still persist it
+        with patch.object(
+            orchestrator, "_step_midi_generation", side_effect=SystemExit(0)
+        ):
+            with pytest.raises(SystemExit):
+                orchestrator.run()
+
+        with open(orchestrator.session_file) as f:
+            assert json.load(f)["state"] == "midi_generation"
+
     def test_completion_deletes_session_file(self, tmp_path):
         """Test session file is deleted on successful completion."""
         orchestrator = WorkflowOrchestrator(
@@ -800,8 +1565,9 @@ class TestSessionPersistence:
             # Complete workflow
             orchestrator.run()
 
-            # Session file should be deleted
+            # Session file and its journal should be deleted
             assert not session_file.exists()
+            assert not Path(f"{session_file}.jrnl").exists()
 
 
 class TestAutoApproveMode:
@@ -2,12 +2,20 @@
 
 import json
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
 from interactive_workflow.state_machine import WorkflowSession, WorkflowState
 
 
+def _append_journal(session, session_file):
+    """Append the session's unsaved changes to its journal, as the orchestrator does."""
+    with open(WorkflowSession.journal_path(session_file), "ab") as f:
+        f.write(session.journal_entry())
+    session.mark_clean()
+
+
 class TestWorkflowState:
     """Tests for WorkflowState enum."""
 
@@ -94,6 +102,30 @@ class TestWorkflowSessionCreation:
         assert isinstance(session.state, WorkflowState)
         assert session.state == WorkflowState.INIT
 
+    def test_unknown_state_string_raises_value_error(self, tmp_path):
+        """Test unknown state strings are rejected on init and load."""
+        with pytest.raises(ValueError, match="not a valid WorkflowState"):
+            WorkflowSession(
+                state="bogus",  # type: ignore[arg-type]
+                song_name="Test",
+                input_video="test.mp4",
+                input_tabs="test.txt",
+            )
+
+        session_file = tmp_path / "session.json"
+        session_file.write_text(
+            json.dumps(
+                {
+                    "state": "bogus",
+                    "song_name": "Test",
+                    "input_video": "test.mp4",
+                    "input_tabs": "test.txt",
+                }
+            )
+        )
+        with pytest.raises(ValueError, match="Corrupted session file"):
+            WorkflowSession.load(str(session_file))
+
 
 class TestWorkflowSessionDataManagement:
     """Tests for session data get/set."""
@@ -310,6 +342,162 @@ class TestWorkflowSessionPersistence:
         session.delete(str(session_file))
         assert not session_file.exists()
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_load_with_each_json_backend(self, tmp_path, use_orjson):
+        """Test sessions round-trip with orjson and the stdlib fallback."""
+        from interactive_workflow import state_machine
+
+        if use_orjson and not state_machine.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+
+        session_file = str(tmp_path / "session.json")
+        with patch.object(state_machine, "ORJSON_AVAILABLE", use_orjson):
+            session = WorkflowSession.create(
+                song_name="Test", input_video="test.mp4", input_tabs="test.txt"
+            )
+            session.set_data("fps", 15)
+            session.save(session_file)
+            session.transition_to(WorkflowState.MIDI_FIXING)
+            _append_journal(session, session_file)
+
+            loaded_session = WorkflowSession.load(session_file)
+
+        assert loaded_session is not None
+        assert loaded_session.state == WorkflowState.MIDI_FIXING
+        assert loaded_session.get_data("fps") == 15
+
+    def test_is_dirty_tracks_changes_since_save(self, tmp_path):
+        """Test mutators mark the session dirty and save clears it."""
+        session_file = str(tmp_path / "session.json")
+        session = WorkflowSession.create(
+            song_name="Test", input_video="test.mp4", input_tabs="test.txt"
+        )
+        assert not session.is_dirty()
+
+        session.set_data("fps", 15)
+        assert session.is_dirty()
+        session.save(session_file)
+        assert not session.is_dirty()
+
+        session.transition_to(WorkflowState.MIDI_GENERATION)
+        assert session.is_dirty()
+
+    def test_save_skips_unchanged_session(self, tmp_path):
+        """Test saving an unchanged session to the same file is a no-op."""
+        session_file = str(tmp_path / "session.json")
+        session = WorkflowSession.create(
+            song_name="Test", input_video="test.mp4", input_tabs="test.txt"
+        )
+        session.save(session_file)
+
+        with patch("interactive_workflow.state_machine.write_file_atomic") as write:
+            session.save(session_file)
+            write.assert_not_called()
+
+            # A different target or a change still writes
+            session.save(str(tmp_path / "other.json"))
+            session.set_data("fps", 15)
+            session.save(session_file)
+            assert write.call_count == 2
+
+    def test_save_after_delete_rewrites_file(self, tmp_path):
+        """Test a deleted session file is written again on the next save."""
+        session_file = tmp_path / "session.json"
+        session = WorkflowSession.create(
+            song_name="Test", input_video="test.mp4", input_tabs="test.txt"
+        )
+        session.save(str(session_file))
+        session.delete(str(session_file))
+
+        session.save(str(session_file))
+        assert session_file.exists()
+
+    def test_journal_replayed_on_load(self, tmp_path):
+        """Test state transitions appended to the journal survive a reload."""
+        session_file = str(tmp_path / "session.json")
+
+        session = WorkflowSession.create(
+            song_name="Test", input_video="test.mp4", input_tabs="test.txt"
+        )
+        session.save(session_file)
+        session.transition_to(WorkflowState.MIDI_GENERATION)
+        assert session.can_journal()
+        _append_journal(session, session_file)
+        session.transition_to(WorkflowState.MIDI_FIXING)
+        _append_journal(session, session_file)
+
+        # Base file is untouched; the journal carries the transitions
+        with open(session_file, "r") as f:
+            assert json.load(f)["state"] == "init"
+
+        loaded_session = WorkflowSession.load(session_file)
+        assert loaded_session is not None
+        assert loaded_session.state == WorkflowState.MIDI_FIXING
+        assert loaded_session.updated_at == session.updated_at
+
+    def test_journal_ignores_torn_last_line(self, tmp_path):
+        """Test a partially written journal line is ignored on load."""
+        session_file = str(tmp_path / "session.json")
+
+        session = WorkflowSession.create(
+            song_name="Test", input_video="test.mp4", input_tabs="test.txt"
+        )
+        session.save(session_file)
+        session.transition_to(WorkflowState.MIDI_GENERATION)
+        _append_journal(session, session_file)
+        with open(WorkflowSession.journal_path(session_file), "a") as f:
+            f.write('{"t": "2024-01-01", "patch": {"state": "midi_fi')
+
+        loaded_session = WorkflowSession.load(session_file)
+        assert loaded_session is not None
+        assert loaded_session.state == WorkflowState.MIDI_GENERATION
+
+    @pytest.mark.parametrize("line", ["[]", "1", '"x"', "null", '{"patch": []}'])
+    def test_journal_skips_non_object_lines(self, tmp_path, line):
+        """Test valid JSON lines that are not patch entries are skipped on load."""
+        session_file = str(tmp_path / "session.json")
+
+        session = WorkflowSession.create(
+            song_name="Test", input_video="test.mp4", input_tabs="test.txt"
+        )
+        session.save(session_file)
+        session.transition_to(WorkflowState.MIDI_GENERATION)
+        _append_journal(session, session_file)
+        with open(WorkflowSession.journal_path(session_file), "a") as f:
+            f.write(line + "\n")
+        session.transition_to(WorkflowState.MIDI_FIXING)
+        _append_journal(session, session_file)
+
+        loaded_session = WorkflowSession.load(session_file)
+        assert loaded_session is not None
+        assert loaded_session.state == WorkflowState.MIDI_FIXING
+
+    def test_save_folds_in_journal(self, tmp_path):
+        """Test a full save supersedes and removes the journal."""
+        session_file = str(tmp_path / "session.json")
+        journal = tmp_path / "session.json.jrnl"
+
+        session = WorkflowSession.create(
+            song_name="Test", input_video="test.mp4", input_tabs="test.txt"
+        )
+        session.save(session_file)
+        session.transition_to(WorkflowState.MIDI_GENERATION)
+        _append_journal(session, session_file)
+        assert journal.exists()
+
+        # Data changes cannot be journaled and force a full rewrite
+        session.set_data("generated_midi", "song.mid")
+        assert not session.can_journal()
+        with pytest.raises(ValueError, match="Cannot journal"):
+            session.journal_entry()
+        session.save(session_file)
+
+        assert not journal.exists()
+        with open(session_file, "r") as f:
+            data = json.load(f)
+        assert data["state"] == "midi_generation"
+        assert data["data"]["generated_midi"] == "song.mid"
+
     def test_delete_nonexistent_session_file(self):
         """Test deleting non-existent session file doesn't raise error."""
         session = WorkflowSession.create(
@@ -161,6 +161,26 @@ class TestNoteEventsToTabs:
         assert tabs.tabs[1].tab == -1  # Draw
         assert tabs.tabs[2].tab == 2  # Blow
 
+    def test_convert_events_from_generator(self, harmonica_hole_mapping, temp_test_dir):
+        """Test that events can be streamed from a generator."""
+        mapper = TabMapper(harmonica_hole_mapping, str(temp_test_dir))
+
+        events = ((float(i), i + 1.0, 60, 0.9, 1.0) for i in range(3))
+
+        with patch("builtins.print"):
+            tabs = mapper.note_events_to_tabs(events)
+
+        assert [entry.time for entry in tabs.tabs] == [0.0, 1.0, 2.0]
+
+    def test_convert_empty_generator_raises_error(
+        self, harmonica_hole_mapping, temp_test_dir
+    ):
+        """Test that an exhausted event stream raises the empty-events error."""
+        mapper = TabMapper(harmonica_hole_mapping, str(temp_test_dir))
+
+        with pytest.raises(TabMapperError, match="No note events provided"):
+            mapper.note_events_to_tabs(iter(()))
+
     def test_convert_empty_events_raises_error(
         self, harmonica_hole_mapping, temp_test_dir
     ):
@@ -582,10 +602,10 @@ class TestBendMapping:
 
     def test_g_harmonica_bends(self, temp_test_dir):
         """Test G harmonica bend mappings."""
-        from tab_converter.consts import G_HARMONICA_BENDS
+        from tab_converter.consts import HARMONICA_BEND_MAPPINGS
 
         harmonica_mapping = {55: 1, 57: -1}
-        bend_mapping = G_HARMONICA_BENDS
+        bend_mapping = HARMONICA_BEND_MAPPINGS["G"]
 
         mapper = TabMapper(harmonica_mapping, str(temp_test_dir), bend_mapping)
 
@@ -689,3 +709,19 @@ class TestCreateTabMapperFactory:
             assert isinstance(mapper, TabMapper), f"Failed for key {key}"
             # Each key should have at least some mappings
             assert len(mapper._mapping) > 0, f"No mappings for key {key}"
+
+    def test_factory_mappings_are_read_only(self, temp_test_dir):
+        """Test shared key mappings cannot be mutated through a mapper."""
+        from tab_converter.consts import HARMONICA_BEND_MAPPINGS
+        from tab_converter.tab_mapper import create_tab_mapper
+
+        mapper = create_tab_mapper("C", output_path=str(temp_test_dir))
+
+        with pytest.raises(TypeError):
+            mapper._mapping[60] = -1
+        with pytest.raises(TypeError):
+            mapper._bend_mapping[61] = (1, "'")
+        with pytest.raises(TypeError):
+            HARMONICA_BEND_MAPPINGS["C"] = {}
+
+        assert C_HARMONICA_MAPPING[60] == 1
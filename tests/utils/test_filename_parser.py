@@ -248,6 +248,15 @@ class TestParseFilename:
         assert config.enable_stem is True
         assert config.fps == 15
 
+    def test_repeated_parse_returns_independent_configs(self):
+        """Test cached parses don't share mutable config objects."""
+        first = parse_filename("Song_KeyG_FPS30.mp4")
+        first.fps = 10
+
+        second = parse_filename("Song_KeyG_FPS30.mp4")
+        assert second.fps == 30
+        assert second is not first
+
 
 class TestKeyNormalization:
     """Tests for key normalization."""
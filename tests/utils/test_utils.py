@@ -20,6 +20,7 @@ from utils.utils import (
     get_midi_info,
     validate_file_path,
     get_file_info,
+    clone_file,
     TEMP_DIR,
     VIDEO_FILES_DIR,
     TAB_FILES_DIR,
@@ -425,6 +426,32 @@ class TestFileUtilities:
         assert info["name"] == "archive.tar.gz"
         assert info["extension"] == ".gz"  # os.path.splitext only gets last extension
 
+    def test_clone_file_copies_content_and_mtime(self, temp_test_dir):
+        """Test that clone_file produces an identical copy with metadata."""
+        src = temp_test_dir / "source.mid"
+        src.write_bytes(b"MThd" + bytes(range(64)))
+        os.utime(src, (1_000_000, 1_000_000))
+        dst = temp_test_dir / "archived.mid"
+
+        clone_file(str(src), str(dst))
+
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime == src.stat().st_mtime
+
+    def test_clone_file_falls_back_to_copy2(self, temp_test_dir):
+        """Test that clone_file copies normally when cloning is unsupported."""
+        src = temp_test_dir / "source.txt"
+        src.write_text("tabs")
+        dst = temp_test_dir / "archived.txt"
+
+        with (
+            patch("utils.utils._reflink", return_value=False),
+            patch("utils.utils.shutil.copy2") as mock_copy2,
+        ):
+            clone_file(str(src), str(dst))
+
+        mock_copy2.assert_called_once_with(str(src), str(dst))
+
 
 class TestUtilsErrorHandling:
     """Test error handling throughout utils module."""
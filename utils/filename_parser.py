@@ -10,7 +10,13 @@ Example filenames:
 
 import os
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
+
+# Filename parameter patterns (compiled once at import)
+_KEY_PATTERN = re.compile(r"^Key([A-G][bB#sS]?)$", re.IGNORECASE)
+_FPS_PATTERN = re.compile(r"^FPS(\d+)$", re.IGNORECASE)
+_TAB_BUFFER_PATTERN = re.compile(r"^TabBuffer([-\d.]+)$", re.IGNORECASE)
 
 
 @dataclass
@@ -66,6 +72,13 @@ def parse_filename(filename: str) -> FilenameConfig:
         >>> parse_filename("/path/to/Tune_KeyBb_TabBuffer0.5.m4v")
         FilenameConfig(song_name='Tune', key='Bb', tab_buffer=0.5, ...)
     """
+    # Parsing is memoized; hand out a copy so callers can't mutate the cache
+    return replace(_parse_filename(filename))
+
+
+@lru_cache(maxsize=32)
+def _parse_filename(filename: str) -> FilenameConfig:
+    """Parse configuration from filename (cached, see parse_filename)."""
     # Extract just the filename (no path)
     base_filename = os.path.basename(filename)
 
@@ -97,7 +110,7 @@ def parse_filename(filename: str) -> FilenameConfig:
     # Parse remaining parts
     for part in parts[1:]:
         # Parse harmonica key (supports both # and S for sharps, b and B for flats)
-        if match := re.match(r"^Key([A-G][bB#sS]?)$", part, re.IGNORECASE):
+        if match := _KEY_PATTERN.match(part):
             config.key = match.group(1).upper()
             # Normalize key notation (FS -> F#, BB -> Bb, etc.)
             config.key = _normalize_key(config.key)
@@ -111,13 +124,13 @@ def parse_filename(filename: str) -> FilenameConfig:
             config.enable_stem = False
 
         # Parse FPS
-        elif match := re.match(r"^FPS(\d+)$", part, re.IGNORECASE):
+        elif match := _FPS_PATTERN.match(part):
             config.fps = int(match.group(1))
             if config.fps <= 0 or config.fps > 60:
                 raise ValueError(f"Invalid FPS value: {config.fps}. Must be 1-60.")
 
         # Parse tab buffer (allow minus sign to catch negative values)
-        elif match := re.match(r"^TabBuffer([-\d.]+)$", part, re.IGNORECASE):
+        elif match := _TAB_BUFFER_PATTERN.match(part):
             config.tab_buffer = float(match.group(1))
             if config.tab_buffer < 0 or config.tab_buffer > 5.0:
                 raise ValueError(